@@ -0,0 +1,207 @@
+import pandas as pd
+import numpy as np
+import heapq
+import os
+import sys
+import time
+
+# Path Management
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.dirname(SCRIPT_DIR)
+BASE_DIR = os.path.dirname(SRC_DIR)
+REGIME_DATA = os.path.join(BASE_DIR, "data", "processed", "regime_v2_status.csv")
+EVENT_REPORT = os.path.join(BASE_DIR, "data", "processed", "event_backtest_results.csv")
+
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+from backtest.performance_engine import build_weight_policy, run_hourly_loop, MAX_DRAWDOWN_LIMIT
+from engine.market_panel import MarketPanel
+from engine.universe import get_benchmark_asset
+
+# Friction Model
+NO_TRADE_BAND = 0.02            # Skip weight changes smaller than 2% of portfolio value
+COST_PER_TURNOVER = 0.0005      # Cost per unit of traded notional (5 bps: half-spread + slippage on liquid ETFs)
+FIXED_ORDER_COST = 0.0          # Flat cost per order (as a fraction of starting capital)
+
+# Benchmark
+BENCHMARK_SCALE = 10            # Synthetic panel = BENCHMARK_SCALE x the hourly history
+
+# Events are ordered by (bar index, kind, seq): all of bar i's work (mark, decide, fill) completes
+# before bar i+1 is marked, even if two bars share a timestamp. Timestamps never drive ordering.
+BAR, SIGNAL, ORDER = 0, 1, 2
+
+
+def run_event_simulation(panel=None, no_trade_band=NO_TRADE_BAND, cost_per_turnover=COST_PER_TURNOVER,
+                         fixed_order_cost=FIXED_ORDER_COST, signal_every=1, write_report=True):
+    """
+    Event-driven backtest that tracks actual holdings.
+    Bars, signals and order fills are processed through a heap-based scheduler; each signal
+    turns target-vs-held weight deltas into orders (outside the no-trade band), and every
+    fill pays a cost proportional to its notional.
+    """
+    if panel is None:
+        if not os.path.exists(REGIME_DATA):
+            print("[ERROR] Regime data not found.")
+            return None
+        panel = MarketPanel.from_csv(REGIME_DATA)
+
+    n = len(panel)
+    if n == 0:
+        return None
+
+    policy = build_weight_policy(panel)
+    prices = panel.prices
+    ticker_pos = {t: panel.ticker_index(t) for t in panel.tickers}
+
+    # Portfolio state
+    units = np.zeros(len(panel.tickers))
+    last_px = np.full(len(panel.tickers), np.nan)
+    cash = 1.0
+    high_water_mark = 1.0
+
+    marks = np.zeros(n)
+    turnover = np.zeros(n)
+    costs = np.zeros(n)
+    trades = np.zeros(n, dtype=np.int32)
+    breaker_flags = np.zeros(n, dtype=bool)
+
+    seq = 0
+    queue = [(0, BAR, seq, None)]
+
+    while queue:
+        i, kind, _, payload = heapq.heappop(queue)
+
+        if kind == BAR:
+            # Mark to market, carrying the last valid price through gaps
+            px = prices[i]
+            last_px = np.where(np.isnan(px), last_px, px)
+            held = units != 0
+            marks[i] = cash + np.dot(units[held], last_px[held])
+            high_water_mark = max(high_water_mark, marks[i])
+
+            # Schedule lazily so the heap only ever holds the current bar's work
+            if i + 1 < n:
+                seq += 1
+                heapq.heappush(queue, (i + 1, BAR, seq, None))
+            if i < n - 1 and i % signal_every == 0:
+                seq += 1
+                heapq.heappush(queue, (i, SIGNAL, seq, None))
+
+        elif kind == SIGNAL:
+            value = marks[i]
+            breaker_flags[i] = (high_water_mark - value) / high_water_mark >= MAX_DRAWDOWN_LIMIT
+            target = policy(i, breaker_flags[i])
+
+            target_w = np.zeros(len(units))
+            for t, w in target.items():
+                if t in ticker_pos:
+                    target_w[ticker_pos[t]] += w
+            current_w = np.where(units != 0, units * np.nan_to_num(last_px), 0.0) / value
+            delta = target_w - current_w
+
+            # Full exits always go through; otherwise respect the no-trade band
+            tradable = ~np.isnan(last_px) & (last_px > 0)
+            for j in np.nonzero(tradable & ((np.abs(delta) > no_trade_band)
+                                            | ((target_w == 0) & (units != 0))))[0]:
+                seq += 1
+                heapq.heappush(queue, (i, ORDER, seq, (j, delta[j] * value / last_px[j])))
+
+        else:
+            j, qty = payload
+            notional = qty * last_px[j]
+            cost = abs(notional) * cost_per_turnover + fixed_order_cost
+            units[j] += qty
+            cash -= notional + cost
+            turnover[i] += abs(notional) / marks[i]
+            costs[i] += cost
+            trades[i] += 1
+
+    # Align with the hourly report: row i holds the value after the (i, i+1] holding period
+    strategy_value = np.append(marks[1:], marks[-1])
+
+    df = pd.DataFrame({
+        'Timestamp': panel.index,
+        'Regime_V2': panel.regime_names(),
+        'Strategy_Value': strategy_value,
+        'Turnover': turnover,
+        'Trading_Cost': costs,
+        'Trades': trades,
+        'Circuit_Breaker_Active': breaker_flags,
+    })
+    benchmark = get_benchmark_asset()
+    if panel.has_ticker(benchmark):
+        bench_px = panel.price(benchmark)
+        df['Benchmark_Value'] = np.append(bench_px[1:], bench_px[-1]) / bench_px[0]
+
+    if write_report:
+        os.makedirs(os.path.dirname(EVENT_REPORT), exist_ok=True)
+        df.to_csv(EVENT_REPORT, index=False)
+    return df
+
+
+def make_scaled_panel(panel, scale, seed=0):
+    """
+    Synthetic benchmark panel: each hourly bar is split into `scale` sub-bars by bootstrapping
+    historical returns (scaled to the sub-bar horizon), keeping the hour's regime and macro state.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(panel)
+    rets = panel.returns[1:]
+    rets = rets[~np.isnan(rets).any(axis=1)]
+
+    draws = rets[rng.integers(0, len(rets), size=n * scale - 1)] / np.sqrt(scale)
+    prices = panel.prices[0] * np.vstack([np.ones((1, len(panel.tickers))), np.cumprod(1 + draws, axis=0)])
+
+    step = np.timedelta64(3600 // scale, 's').astype('timedelta64[ns]')
+    index = panel.index[0] + np.arange(n * scale) * step
+
+    return MarketPanel(index=index,
+                       tickers=panel.tickers,
+                       prices=prices.astype(panel.prices.dtype),
+                       macro_columns=panel.macro_columns,
+                       macro=np.repeat(panel.macro, scale, axis=0),
+                       regime_labels=panel.regime_labels,
+                       regime_codes=np.repeat(panel.regime_codes, scale))
+
+
+def benchmark_engines(panel=None, scale=BENCHMARK_SCALE):
+    """Times the hourly loop against the event-driven simulator on real and scaled-up bars."""
+    if panel is None:
+        panel = MarketPanel.from_csv(REGIME_DATA)
+
+    results = []
+    for label, bench_panel in [("hourly", panel), (f"x{scale} bars", make_scaled_panel(panel, scale))]:
+        # Warm the optimizer cache so both engines are timed on the same footing
+        run_hourly_loop(bench_panel)
+
+        start = time.perf_counter()
+        strat_rets, _ = run_hourly_loop(bench_panel)
+        loop_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        event_df = run_event_simulation(bench_panel, write_report=False)
+        event_secs = time.perf_counter() - start
+
+        results.append({
+            "Panel": label,
+            "Bars": len(bench_panel),
+            "Hourly_Loop_s": loop_secs,
+            "Event_Sim_s": event_secs,
+            "Hourly_Loop_Final": float(np.prod(1 + np.nan_to_num(strat_rets))),
+            "Event_Sim_Final": float(event_df['Strategy_Value'].iloc[-1]),
+            "Event_Turnover": float(event_df['Turnover'].sum()),
+            "Event_Costs": float(event_df['Trading_Cost'].sum()),
+        })
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    df = run_event_simulation()
+    if df is not None:
+        print(f"[SUCCESS] Event-Driven Simulation Complete. Report saved to {EVENT_REPORT}")
+        print(f"          Final Value: {df['Strategy_Value'].iloc[-1]:.4f} | "
+              f"Trades: {df['Trades'].sum()} | Turnover: {df['Turnover'].sum():.2f}x | "
+              f"Costs: {df['Trading_Cost'].sum()*100:.3f}%")
+        print("\n--- ENGINE BENCHMARK ---")
+        print(benchmark_engines().to_string(index=False))
@@ -1,11 +1,12 @@
 import pandas as pd
 import numpy as np
 import os
-from scipy.optimize import minimize
+import sys
 
 # Path Management
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-BASE_DIR = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+SRC_DIR = os.path.dirname(SCRIPT_DIR)
+BASE_DIR = os.path.dirname(SRC_DIR)
 REGIME_DATA = os.path.join(BASE_DIR, "data", "processed", "regime_v2_status.csv")
 PERFORMANCE_REPORT = os.path.join(BASE_DIR, "data", "processed", "backtest_results.csv")
 
@@ -14,44 +15,93 @@ VIX_THRESHOLD = 20.0
 FRICTION_COST = 0.0002 
 MAX_DRAWDOWN_LIMIT = 0.05
 
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+from engine.optimizer import solve_min_variance, estimate_covariance, default_growth_weights
+from engine.optimizer_cache import get_default_cache
+from engine.market_panel import MarketPanel
+from engine.universe import (get_market_tickers, get_growth_assets, get_core_assets, get_defensive_asset,
+                             get_benchmark_asset)
+
 def get_rolling_optimal_weights(returns_window, assets):
-    """Calculates Minimum Variance weights using a localized historical window."""
+    """Calculates Minimum Variance weights using a localized historical window (DataFrame or ndarray)."""
     if len(returns_window) < 10:
-        return {"QQQ": 0.6, "SPY": 0.4} # Fallback if not enough data
+        return default_growth_weights() # Fallback if not enough data
         
-    cov_matrix = returns_window.cov().values
+    # Sample covariance for small universes, shrinkage once assets outgrow the window
+    cov_matrix = estimate_covariance(returns_window)
     
-    def portfolio_variance(w):
-        return np.dot(w.T, np.dot(cov_matrix, w))
+    # Memoized: identical windows (reruns, flat hours) skip the solver entirely
+    weights = solve_min_variance(cov_matrix, assets)
+    if weights is not None:
+        return weights
+    return default_growth_weights()
 
-    constraints = ({'type': 'eq', 'fun': lambda x: np.sum(x) - 1})
-    bounds = tuple((0, 1) for _ in range(len(assets)))
-    init_guess = [1.0/len(assets)] * len(assets)
+def build_weight_policy(panel):
+    """
+    Returns policy(i, circuit_breaker_active) -> target weights for bar i.
+    Shared by the hourly loop and the event-driven simulator.
+    """
+    growth_assets = [t for t in get_growth_assets() if panel.has_ticker(t)]
+    equity_list = set(get_growth_assets()) | set(get_core_assets())
+    primary, secondary = get_core_assets()
+    defensive = get_defensive_asset()
 
-    opt = minimize(portfolio_variance, init_guess, method='SLSQP', bounds=bounds, constraints=constraints)
-    
-    if opt.success:
-        return dict(zip(assets, np.round(opt.x, 2)))
-    return {"QQQ": 0.6, "SPY": 0.4}
-
-def run_performance_engine():
-    if not os.path.exists(REGIME_DATA): 
-        print("[ERROR] Regime data not found.")
-        return
-        
-    df = pd.read_csv(REGIME_DATA)
-    df['Timestamp'] = pd.to_datetime(df['Timestamp']).dt.tz_localize(None)
-    df = df.sort_values('Timestamp').reset_index(drop=True)
-    
-    tickers = ["QQQ", "SPY", "GLD", "SHY", "XLF", "XLU"]
-    
-    # Calculate base unshifted returns for the optimizer's historical window
-    historical_returns = df[tickers].pct_change()
+    vix_series = panel.macro_series('VIX_Index')
+    regime_codes = panel.regime_codes
+    growth_code = panel.regime_code("Goldilocks (Growth)")
+    trim_code = panel.regime_code("Goldilocks (Overbought - Trim)")
+    oversold_code = panel.regime_code("Goldilocks (Oversold - Opportunity)")
+
+    def policy(i, is_circuit_breaker_active):
+        if is_circuit_breaker_active:
+            return {defensive: 1.0}
+
+        regime = regime_codes[i]
+        # --- WALK-FORWARD OPTIMIZATION ---
+        if regime == growth_code:
+            if i >= 30:
+                # Look strictly BACKWARDS at the last 30 hours
+                window_rets = panel.window(i, 30, growth_assets)
+                window_rets = window_rets[~np.isnan(window_rets).any(axis=1)]
+                weights = get_rolling_optimal_weights(window_rets, growth_assets)
+            else:
+                weights = default_growth_weights() # Burn-in period
+        elif regime == trim_code:
+            weights = {primary: 0.2, secondary: 0.2, defensive: 0.6}
+        elif regime == oversold_code:
+            weights = {primary: 0.7, secondary: 0.3}
+        else:
+            weights = {defensive: 1.0}
+
+        # Apply VIX Governor
+        final_weights = weights.copy()
+        if vix_series[i] > VIX_THRESHOLD:
+            reduction_pool = 0
+            for t, w in weights.items():
+                if t in equity_list:
+                    final_weights[t] = w * 0.5
+                    reduction_pool += (w * 0.5)
+            final_weights[defensive] = final_weights.get(defensive, 0) + reduction_pool
+        return final_weights
+
+    return policy
+
+def market_return_columns(panel):
+    """{ticker: column in panel.forward_returns} for the market tickers present in the panel."""
+    return {t: panel.ticker_index(t) for t in get_market_tickers() if panel.has_ticker(t)}
+
+def run_hourly_loop(panel, friction_cost=FRICTION_COST):
+    """Bar-by-bar walk-forward loop with flat regime-change friction. Returns (strategy returns, breaker flags)."""
+    policy = build_weight_policy(panel)
+
+    # Shifted (-1) returns for the actual strategy execution: row i realises (i, i+1]
+    fwd_rets = panel.forward_returns
+    ret_col = market_return_columns(panel)
     
-    # Calculate shifted (-1) returns for the actual strategy execution
-    for t in tickers:
-        if t in df.columns:
-            df[f"{t}_Ret"] = df[t].pct_change().shift(-1)
+    n = len(panel)
+    regime_codes = panel.regime_codes
 
     strat_rets = []
     circuit_breaker_flags = []
@@ -60,54 +110,26 @@ def run_performance_engine():
     current_strategy_value = 1.0
     high_water_mark = 1.0
     
-    for i in range(len(df)):
-        if i == len(df) - 1:
+    for i in range(n):
+        if i == n - 1:
             strat_rets.append(0)
             circuit_breaker_flags.append(False)
             break
             
-        row = df.iloc[i]
-        regime = row['Regime_V2']
-        vix = row['VIX_Index']
+        regime = regime_codes[i]
         
         # --- CIRCUIT BREAKER ---
         current_drawdown = (high_water_mark - current_strategy_value) / high_water_mark
         is_circuit_breaker_active = current_drawdown >= MAX_DRAWDOWN_LIMIT
         
-        if is_circuit_breaker_active:
-            final_weights = {"SHY": 1.0}
-        else:
-            # --- WALK-FORWARD OPTIMIZATION ---
-            if regime == "Goldilocks (Growth)":
-                if i >= 30:
-                    # Look strictly BACKWARDS at the last 30 hours
-                    window_rets = historical_returns.iloc[i-30:i+1][["QQQ", "SPY", "XLF", "XLU"]].dropna()
-                    weights = get_rolling_optimal_weights(window_rets, ["QQQ", "SPY", "XLF", "XLU"])
-                else:
-                    weights = {"QQQ": 0.60, "SPY": 0.40} # Burn-in period
-            elif regime == "Goldilocks (Overbought - Trim)":
-                weights = {"QQQ": 0.2, "SPY": 0.2, "SHY": 0.6}
-            elif regime == "Goldilocks (Oversold - Opportunity)":
-                weights = {"QQQ": 0.7, "SPY": 0.3}
-            else:
-                weights = {"SHY": 1.0}
-
-            # Apply VIX Governor
-            final_weights = weights.copy()
-            if vix > VIX_THRESHOLD:
-                equity_list = ["QQQ", "SPY", "XLF", "XLU"]
-                reduction_pool = 0
-                for t, w in weights.items():
-                    if t in equity_list:
-                        final_weights[t] = w * 0.5
-                        reduction_pool += (w * 0.5)
-                final_weights["SHY"] = final_weights.get("SHY", 0) + reduction_pool
+        final_weights = policy(i, is_circuit_breaker_active)
 
         # 3. Execution (Apply calculated weights to the NEXT hour's return)
-        hourly_ret = sum(df[f"{k}_Ret"].iloc[i] * v for k, v in final_weights.items() if f"{k}_Ret" in df.columns)
+        row_rets = fwd_rets[i]
+        hourly_ret = sum(row_rets[ret_col[k]] * v for k, v in final_weights.items() if k in ret_col)
         
-        if last_regime and regime != last_regime:
-            hourly_ret -= FRICTION_COST
+        if last_regime is not None and regime != last_regime:
+            hourly_ret -= friction_cost
             
         strat_rets.append(hourly_ret)
         circuit_breaker_flags.append(is_circuit_breaker_active)
@@ -116,16 +138,43 @@ def run_performance_engine():
         current_strategy_value *= (1 + hourly_ret)
         high_water_mark = max(high_water_mark, current_strategy_value)
 
+    return strat_rets, circuit_breaker_flags
+
+def run_performance_engine(panel=None):
+    if panel is None:
+        if not os.path.exists(REGIME_DATA): 
+            print("[ERROR] Regime data not found.")
+            return
+        panel = MarketPanel.from_csv(REGIME_DATA)
+    
+    strat_rets, circuit_breaker_flags = run_hourly_loop(panel)
+
+    # Report frame: original columns plus the shifted return matrix, added in one block
+    df = panel.to_frame()
+    shifted = np.vstack([panel.forward_returns, np.full((1, len(panel.tickers)), np.nan)])
+    df = pd.concat([df, pd.DataFrame({f"{t}_Ret": shifted[:, j] for t, j in market_return_columns(panel).items()})],
+                   axis=1)
+
     # 4. Finalize Metrics
     df['Strategy_Value'] = (1 + pd.Series(strat_rets).fillna(0)).cumprod()
-    df['Benchmark_Value'] = (1 + df['SPY_Ret'].fillna(0)).cumprod()
-    df['Alpha_Basis'] = (df['Strategy_Value'] - df['Benchmark_Value']) * 100
+    benchmark = get_benchmark_asset()
+    if f"{benchmark}_Ret" in df.columns:
+        df['Benchmark_Value'] = (1 + df[f"{benchmark}_Ret"].fillna(0)).cumprod()
+        df['Alpha_Basis'] = (df['Strategy_Value'] - df['Benchmark_Value']) * 100
+    else:
+        print(f"[WARNING] Benchmark {benchmark} not in regime data; report has no Benchmark_Value/Alpha_Basis.")
     df['Circuit_Breaker_Active'] = circuit_breaker_flags
 
     df.to_csv(PERFORMANCE_REPORT, index=False)
+
+    opt_cache = get_default_cache()
+    opt_cache.flush()
+    stats = opt_cache.stats()
     
     print(f"[SUCCESS] Walk-Forward Optimization Complete.")
-    print(f"          Final Alpha (Out-of-Sample): {df['Alpha_Basis'].iloc[-1]:.2f}%")
+    if 'Alpha_Basis' in df.columns:
+        print(f"          Final Alpha (Out-of-Sample): {df['Alpha_Basis'].iloc[-1]:.2f}%")
+    print(f"          Optimizer Cache: {stats['hits']} hits ({stats['disk_hits']} from disk) / {stats['misses']} misses")
 
 if __name__ == "__main__":
     run_performance_engine()
\ No newline at end of file
@@ -4,13 +4,20 @@ import yfinance as yf
 from fredapi import Fred
 from dotenv import load_dotenv
 import ssl
+import sys
 
 ssl._create_default_https_context = ssl._create_unverified_context
 load_dotenv()
 FRED_KEY = os.getenv("FRED_API_KEY")
 
-# Tickers needed for the Strategy Map
-TICKERS = ["SPY", "QQQ", "GLD", "SHY", "XLF", "XLU"]
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+from engine.universe import get_market_tickers
+
+# Tickers needed for the Strategy Map (configurable via SENTINEL_UNIVERSE)
+TICKERS = get_market_tickers()
 
 # --- UPDATED INDICATORS ---
 # Added M2SL for Liquidity tracking
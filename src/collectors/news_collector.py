@@ -1,4 +1,5 @@
 import os
+import sys
 import requests
 import pandas as pd
 from datetime import datetime
@@ -8,7 +9,11 @@ from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 # Environment-Agnostic Path Management
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 BASE_DIR = os.path.dirname(os.path.dirname(SCRIPT_DIR))
-STREAM_PATH = os.path.join(BASE_DIR, "data", "raw", "news_stream_history.csv")
+
+if os.path.dirname(SCRIPT_DIR) not in sys.path:
+    sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from collectors.stream_log import append_records, ensure_log, LOG_PATH as STREAM_PATH
 
 load_dotenv()
 NEWS_API_KEY = os.getenv("NEWS_API_KEY")
@@ -55,12 +60,10 @@ def fetch_indicator_stream():
 
     if new_results:
         new_df = pd.DataFrame(new_results)
-        os.makedirs(os.path.dirname(STREAM_PATH), exist_ok=True)
         
-        if not os.path.exists(STREAM_PATH):
-            new_df.to_csv(STREAM_PATH, index=False)
-        else:
-            new_df.to_csv(STREAM_PATH, mode='a', header=False, index=False)
+        # Append-only log with a time index; a killed run never leaves torn rows
+        ensure_log()
+        append_records(new_df)
         print(f"[SUCCESS] Appended {len(new_results)} records to {STREAM_PATH}")
 
 if __name__ == "__main__":
@@ -0,0 +1,296 @@
+import pandas as pd
+import numpy as np
+import mmap
+import os
+import struct
+import zlib
+
+# Environment-Agnostic Path Management
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+LEGACY_CSV_PATH = os.path.join(BASE_DIR, "data", "raw", "news_stream_history.csv")
+LOG_PATH = os.path.join(BASE_DIR, "data", "raw", "news_stream.log")
+
+# --- On-disk layout ---
+# The log is the tracked record of the stream. The legacy CSV is read once, to migrate (ensure_log);
+# export_csv() writes a CSV view from the log.
+# Log:   [magic | payload_len | crc32(payload)] + payload, appended only
+# Payload: timestamp ns (int64) | sentiment (float64) | Published_At | Indicator | Headline
+#          (each string: uint32 length + utf-8 bytes)
+# Index: sidecar "<log>.idx" of fixed 16-byte (timestamp ns, byte offset) entries, memory-mappable
+RECORD_MAGIC = b"NSR1"
+HEADER = struct.Struct("<4sII")
+FIXED = struct.Struct("<qd")
+STR_LEN = struct.Struct("<I")
+INDEX_DTYPE = np.dtype([("ts", "<i8"), ("offset", "<u8")])
+
+COLUMNS = ["Timestamp", "Published_At", "Indicator", "Sentiment", "Headline"]
+
+
+def index_path_for(log_path):
+    return log_path + ".idx"
+
+
+def _text(value):
+    return "" if value is None or (isinstance(value, float) and np.isnan(value)) else str(value)
+
+
+def _encode_record(row):
+    payload = bytearray(FIXED.pack(pd.Timestamp(row["Timestamp"]).value, float(row["Sentiment"])))
+    for col in ("Published_At", "Indicator", "Headline"):
+        raw = _text(row.get(col)).encode("utf-8")
+        payload += STR_LEN.pack(len(raw)) + raw
+    return HEADER.pack(RECORD_MAGIC, len(payload), zlib.crc32(payload)) + payload
+
+
+def _decode_record(buf, offset):
+    _, length, _ = HEADER.unpack_from(buf, offset)
+    pos = offset + HEADER.size
+    ts, sentiment = FIXED.unpack_from(buf, pos)
+    pos += FIXED.size
+    fields = []
+    for _ in range(3):
+        (n,) = STR_LEN.unpack_from(buf, pos)
+        pos += STR_LEN.size
+        fields.append(bytes(buf[pos:pos + n]).decode("utf-8"))
+        pos += n
+    return ts, fields[0], fields[1], sentiment, fields[2]
+
+
+def _valid_record_end(buf, offset):
+    """End offset of a complete, checksummed record at `offset`, or None if torn/corrupt."""
+    if offset + HEADER.size > len(buf):
+        return None
+    magic, length, crc = HEADER.unpack_from(buf, offset)
+    end = offset + HEADER.size + length
+    if magic != RECORD_MAGIC or end > len(buf):
+        return None
+    if zlib.crc32(buf[offset + HEADER.size:end]) != crc:
+        return None
+    return end
+
+
+def _record_fits(buf, offset, size):
+    """True if the header and the payload it announces both lie inside the first `size` bytes."""
+    if offset + HEADER.size > size:
+        return False
+    _, length, _ = HEADER.unpack_from(buf, offset)
+    return offset + HEADER.size + length <= size
+
+
+def _fsync_append(path, data):
+    with open(path, "ab") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def recover(log_path=LOG_PATH):
+    """
+    Brings log and index back to a consistent state after an interrupted append:
+    - drops a torn trailing index entry and trailing entries that no longer point at a valid record,
+    - re-indexes complete records written after the last index entry,
+    - truncates a torn trailing record.
+    Only the tail is inspected; earlier entries were fsynced before any later append started.
+    Returns the number of indexed records.
+    """
+    idx_path = index_path_for(log_path)
+    if not os.path.exists(log_path) or os.path.getsize(log_path) == 0:
+        if os.path.exists(idx_path):
+            os.remove(idx_path)
+        return 0
+
+    log_size = os.path.getsize(log_path)
+    idx_size = os.path.getsize(idx_path) if os.path.exists(idx_path) else 0
+    n_entries = idx_size // INDEX_DTYPE.itemsize
+
+    with open(log_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            # Walk back to the last index entry that points at a complete record
+            keep, scan_from = n_entries, 0
+            if n_entries:
+                index = np.memmap(idx_path, dtype=INDEX_DTYPE, mode="r", shape=(n_entries,))
+                while keep:
+                    offset = int(index["offset"][keep - 1])
+                    end = _valid_record_end(buf, offset) if offset < log_size else None
+                    if end is not None:
+                        scan_from = end
+                        break
+                    keep -= 1
+                del index
+
+            # Records that reached the log but not the index
+            extra = []
+            while True:
+                end = _valid_record_end(buf, scan_from)
+                if end is None:
+                    break
+                extra.append((_decode_record(buf, scan_from)[0], scan_from))
+                scan_from = end
+
+    if scan_from < log_size:
+        with open(log_path, "r+b") as f:
+            f.truncate(scan_from)
+            os.fsync(f.fileno())
+
+    if keep < n_entries or idx_size != keep * INDEX_DTYPE.itemsize:
+        with open(idx_path, "r+b") as f:
+            f.truncate(keep * INDEX_DTYPE.itemsize)
+            os.fsync(f.fileno())
+    if extra:
+        _fsync_append(idx_path, np.array(extra, dtype=INDEX_DTYPE).tobytes())
+
+    return keep + len(extra)
+
+
+def append_records(df, log_path=LOG_PATH):
+    """
+    Crash-safe append: records are written and fsynced to the log first, then indexed.
+    A kill between the two leaves complete but unindexed records, which recover() re-indexes;
+    a kill mid-record leaves a torn tail, which recover() truncates. Readers only follow the index.
+    """
+    if df is None or len(df) == 0:
+        return 0
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    recover(log_path)
+
+    offset = os.path.getsize(log_path) if os.path.exists(log_path) else 0
+    blob = bytearray()
+    entries = np.empty(len(df), dtype=INDEX_DTYPE)
+    for k, row in enumerate(df.to_dict("records")):
+        entries[k] = (pd.Timestamp(row["Timestamp"]).value, offset + len(blob))
+        blob += _encode_record(row)
+
+    _fsync_append(log_path, bytes(blob))
+    _fsync_append(index_path_for(log_path), entries.tobytes())
+    return len(df)
+
+
+def _empty_frame():
+    df = pd.DataFrame({c: pd.Series(dtype=object) for c in COLUMNS})
+    df["Timestamp"] = pd.to_datetime(df["Timestamp"])
+    df["Sentiment"] = df["Sentiment"].astype(float)
+    return df
+
+
+def read_stream(start=None, end=None, log_path=LOG_PATH):
+    """
+    Returns stream records with start <= Timestamp <= end (either bound optional).
+    The index is memory-mapped and binary-searched; only records in the window are decoded.
+    """
+    idx_path = index_path_for(log_path)
+    if not os.path.exists(log_path) or not os.path.exists(idx_path):
+        return _empty_frame()
+
+    log_size = os.path.getsize(log_path)
+    n_entries = os.path.getsize(idx_path) // INDEX_DTYPE.itemsize
+    if n_entries == 0 or log_size == 0:
+        return _empty_frame()
+
+    index = np.memmap(idx_path, dtype=INDEX_DTYPE, mode="r", shape=(n_entries,))
+    ts = index["ts"]
+    lo_ns = pd.Timestamp(start).value if start is not None else None
+    hi_ns = pd.Timestamp(end).value if end is not None else None
+
+    if np.all(ts[1:] >= ts[:-1]):
+        lo = np.searchsorted(ts, lo_ns, side="left") if lo_ns is not None else 0
+        hi = np.searchsorted(ts, hi_ns, side="right") if hi_ns is not None else n_entries
+        offsets = np.asarray(index["offset"][lo:hi])
+    else:
+        # Out-of-order appends (clock skew): fall back to a vectorised mask over the index
+        mask = np.ones(n_entries, dtype=bool)
+        if lo_ns is not None:
+            mask &= ts >= lo_ns
+        if hi_ns is not None:
+            mask &= ts <= hi_ns
+        offsets = np.asarray(index["offset"][mask])
+    del index, ts
+
+    if len(offsets) == 0:
+        return _empty_frame()
+
+    with open(log_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            # Skip entries whose record is not fully inside the log (e.g. a log truncated under us)
+            rows = [_decode_record(buf, int(off)) for off in offsets
+                    if _record_fits(buf, int(off), log_size)]
+
+    if not rows:
+        return _empty_frame()
+    df = pd.DataFrame(rows, columns=COLUMNS)
+    df["Timestamp"] = pd.to_datetime(df["Timestamp"], unit="ns")
+    return df
+
+
+def last_indexed(log_path=LOG_PATH):
+    """
+    (newest timestamp ns, number of records carrying it) from the index alone, or (None, 0).
+    Assumes the chronological appends this module makes; no record is decoded.
+    """
+    idx_path = index_path_for(log_path)
+    n_entries = os.path.getsize(idx_path) // INDEX_DTYPE.itemsize if os.path.exists(idx_path) else 0
+    if n_entries == 0:
+        return None, 0
+    ts = np.memmap(idx_path, dtype=INDEX_DTYPE, mode="r", shape=(n_entries,))["ts"]
+    newest = int(ts[-1])
+    count = int(n_entries - np.searchsorted(ts, newest, side="left"))
+    del ts
+    return newest, count
+
+
+def import_csv(csv_path=LEGACY_CSV_PATH, log_path=LOG_PATH):
+    """
+    Appends CSV rows the log does not hold yet, resuming after the log's newest timestamp.
+    Rows sharing that timestamp are matched by count, so an import cut short at any record
+    boundary resumes without gaps or duplicates.
+    """
+    if not os.path.exists(csv_path):
+        return 0
+    df = pd.read_csv(csv_path)
+    df["Timestamp"] = pd.to_datetime(df["Timestamp"])
+    df = df.sort_values("Timestamp", kind="stable")
+
+    recover(log_path)
+    newest, count = last_indexed(log_path)
+    if newest is not None:
+        ts = df["Timestamp"].values.astype("datetime64[ns]").astype(np.int64)
+        start = np.searchsorted(ts, newest, side="left")
+        already = min(count, int(np.searchsorted(ts, newest, side="right") - start))
+        df = df.iloc[start + already:]
+    return append_records(df, log_path)
+
+
+def ensure_log(log_path=LOG_PATH, csv_path=LEGACY_CSV_PATH):
+    """
+    One-time migration from the legacy CSV; once the log exists this is a single stat().
+    The log is built under a temporary name and renamed into place (index first), so an
+    interrupted migration leaves no log behind and is simply redone on the next call.
+    """
+    if os.path.exists(log_path) or not os.path.exists(csv_path):
+        return 0
+    tmp_log = log_path + ".migrating"
+    for path in (tmp_log, index_path_for(tmp_log)):
+        if os.path.exists(path):
+            os.remove(path)
+
+    imported = import_csv(csv_path, tmp_log)
+    if imported == 0:
+        return 0
+    os.replace(index_path_for(tmp_log), index_path_for(log_path))
+    os.replace(tmp_log, log_path)
+    print(f"[INFO] Migrated {imported} records from {csv_path} to {log_path}")
+    return imported
+
+
+def export_csv(csv_path, start=None, end=None, log_path=LOG_PATH):
+    """Writes the stream (or a window of it) to CSV through a temp file + rename, so the CSV is never torn."""
+    df = read_stream(start, end, log_path)
+    tmp_path = csv_path + ".tmp"
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, csv_path)
+    return len(df)
+
+
+if __name__ == "__main__":
+    ensure_log()
+    print(f"[SUCCESS] {recover()} records in {LOG_PATH}")
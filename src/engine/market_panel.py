@@ -0,0 +1,175 @@
+import pandas as pd
+import numpy as np
+import os
+import sys
+
+# Path Management
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.dirname(SCRIPT_DIR)
+BASE_DIR = os.path.dirname(SRC_DIR)
+REGIME_DATA = os.path.join(BASE_DIR, "data", "processed", "regime_v2_status.csv")
+
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+from engine.universe import get_market_tickers
+
+REGIME_COL = "Regime_V2"
+TIME_COL = "Timestamp"
+
+
+class MarketPanel:
+    """
+    Compact, typed view of the hourly market/macro grid.
+
+    - index:   datetime64[ns] array (parsed once)
+    - prices:  C-contiguous (rows x tickers) float array
+    - macro:   C-contiguous (rows x macro columns) float array
+    - regimes: int8 codes into `regime_labels`
+
+    Returns are computed once and handed out as zero-copy views.
+    """
+
+    def __init__(self, index, tickers, prices, macro_columns, macro,
+                 regime_labels=None, regime_codes=None, columns=None):
+        self.index = np.asarray(index, dtype="datetime64[ns]")
+        self.tickers = list(tickers)
+        self.prices = np.ascontiguousarray(prices)
+        self.macro_columns = list(macro_columns)
+        self.macro = np.ascontiguousarray(macro)
+        self.regime_labels = list(regime_labels) if regime_labels is not None else []
+        self.regime_codes = (np.asarray(regime_codes, dtype=np.int8) if regime_codes is not None
+                             else np.full(len(self.index), -1, dtype=np.int8))
+        # Original column order, so to_frame() round-trips the CSV layout
+        self.columns = list(columns) if columns is not None else (
+            self.macro_columns + self.tickers + ([REGIME_COL] if self.regime_labels else []))
+
+        self._ticker_pos = {t: j for j, t in enumerate(self.tickers)}
+        self._macro_pos = {c: j for j, c in enumerate(self.macro_columns)}
+        self._returns = None
+
+    # --- Construction ---
+    @classmethod
+    def from_frame(cls, df, tickers=None, regime_col=REGIME_COL, dtype=np.float64):
+        """Builds a panel from a wide DataFrame (Timestamp column or datetime index)."""
+        if TIME_COL in df.columns:
+            timestamps = pd.to_datetime(df[TIME_COL])
+            body = df.drop(columns=[TIME_COL])
+        else:
+            timestamps = pd.to_datetime(pd.Series(df.index, index=df.index))
+            body = df
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_localize(None)
+
+        # Chronological order, parsed exactly once
+        order = np.argsort(timestamps.to_numpy(dtype="datetime64[ns]"), kind="stable")
+        index = timestamps.to_numpy(dtype="datetime64[ns]")[order]
+        body = body.iloc[order]
+
+        tickers = [t for t in (tickers or get_market_tickers()) if t in body.columns]
+        macro_columns = [c for c in body.columns
+                         if c not in tickers and c != regime_col
+                         and pd.api.types.is_numeric_dtype(body[c])]
+
+        regime_labels, regime_codes = None, None
+        if regime_col in body.columns:
+            cat = pd.Categorical(body[regime_col])
+            regime_labels = list(cat.categories)
+            regime_codes = cat.codes.astype(np.int8)
+
+        return cls(index=index,
+                   tickers=tickers,
+                   prices=body[tickers].to_numpy(dtype=dtype),
+                   macro_columns=macro_columns,
+                   macro=body[macro_columns].to_numpy(dtype=dtype),
+                   regime_labels=regime_labels,
+                   regime_codes=regime_codes,
+                   columns=[TIME_COL] + [c for c in body.columns
+                                         if c in tickers or c in macro_columns or c == regime_col])
+
+    @classmethod
+    def from_csv(cls, path=REGIME_DATA, tickers=None, dtype=np.float64):
+        return cls.from_frame(pd.read_csv(path), tickers=tickers, dtype=dtype)
+
+    def to_frame(self):
+        """Rebuilds the wide DataFrame (original column order) for reporting/CSV output."""
+        data = {TIME_COL: self.index}
+        for c, j in self._macro_pos.items():
+            data[c] = self.macro[:, j]
+        for t, j in self._ticker_pos.items():
+            data[t] = self.prices[:, j]
+        if self.regime_labels:
+            data[REGIME_COL] = self.regime_names()
+        return pd.DataFrame({c: data[c] for c in self.columns if c in data})
+
+    # --- Lookups ---
+    def __len__(self):
+        return len(self.index)
+
+    def ticker_index(self, tickers):
+        """Column positions for a ticker (or list of tickers) in the price array."""
+        if isinstance(tickers, str):
+            return self._ticker_pos[tickers]
+        return [self._ticker_pos[t] for t in tickers if t in self._ticker_pos]
+
+    def has_ticker(self, ticker):
+        return ticker in self._ticker_pos
+
+    def price(self, ticker):
+        """Zero-copy (strided) view of one ticker's price column."""
+        return self.prices[:, self._ticker_pos[ticker]]
+
+    def macro_series(self, column, default=None):
+        """Zero-copy view of one macro column; `default` fills when the column is absent."""
+        if column not in self._macro_pos:
+            if default is None:
+                raise KeyError(column)
+            return np.full(len(self), default, dtype=self.macro.dtype)
+        return self.macro[:, self._macro_pos[column]]
+
+    def regime_code(self, label):
+        """int8 code for a regime label, or -1 if the label never occurs."""
+        try:
+            return self.regime_labels.index(label)
+        except ValueError:
+            return -1
+
+    def regime_label(self, i):
+        code = self.regime_codes[i]
+        return self.regime_labels[code] if code >= 0 else None
+
+    def regime_names(self):
+        labels = np.array(self.regime_labels + [None], dtype=object)
+        return labels[self.regime_codes]
+
+    # --- Returns ---
+    @property
+    def returns(self):
+        """Simple period returns (row 0 is NaN), computed once per panel."""
+        if self._returns is None:
+            rets = np.empty_like(self.prices)
+            rets[0] = np.nan
+            np.divide(self.prices[1:], self.prices[:-1], out=rets[1:])
+            rets[1:] -= 1
+            self._returns = rets
+        return self._returns
+
+    @property
+    def forward_returns(self):
+        """Zero-copy view where row i is the return realised over (i, i+1]; one row shorter than the panel."""
+        return self.returns[1:]
+
+    def window(self, end, length, tickers=None):
+        """
+        Trailing returns window covering rows [end-length, end] inclusive.
+        Without `tickers` this is a zero-copy view; a ticker subset copies only the window.
+        """
+        block = self.returns[max(end - length, 0):end + 1]
+        if tickers is None:
+            return block
+        return block[:, self.ticker_index(tickers)]
+
+    @property
+    def nbytes(self):
+        return (self.index.nbytes + self.prices.nbytes + self.macro.nbytes
+                + self.regime_codes.nbytes)
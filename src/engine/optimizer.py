@@ -1,56 +1,165 @@
 import pandas as pd
 import numpy as np
-from scipy.optimize import minimize
 import os
+import sys
 
 # Path Management
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-BASE_DIR = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+SRC_DIR = os.path.dirname(SCRIPT_DIR)
+BASE_DIR = os.path.dirname(SRC_DIR)
 REGIME_DATA = os.path.join(BASE_DIR, "data", "processed", "regime_v2_status.csv")
 
-def get_optimal_growth_weights():
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+from engine.optimizer_cache import get_default_cache, make_cache_key, get_cache_stats
+
+from engine.universe import get_growth_assets, get_core_assets
+
+# Solver / estimator scaling
+SHRINKAGE_OBS_RATIO = 3      # "auto" uses sample covariance only when rows >= ratio * assets
+PG_MAX_ITER = 5000
+PG_TOLERANCE = 1e-9
+
+# Cache tag: any change to solver choice or settings must change this string
+SOLVER_TAG = f"fista:{PG_MAX_ITER}:{PG_TOLERANCE}"
+
+def default_growth_weights():
+    """60/40 core mix used for burn-in and whenever the optimizer cannot run."""
+    primary, secondary = get_core_assets()
+    return {primary: 0.6, secondary: 0.4}
+
+def _ledoit_wolf(returns):
+    """Ledoit-Wolf shrinkage towards a scaled identity; stays well-conditioned when rows < assets."""
+    X = returns - returns.mean(axis=0)
+    n_obs, n_assets = X.shape
+    emp_cov = X.T @ X / n_obs
+    mu = np.trace(emp_cov) / n_assets
+
+    X2 = X ** 2
+    beta_ = np.sum(X2.T @ X2) / n_obs
+    delta_ = np.sum(emp_cov ** 2)
+    beta = (beta_ - delta_) / (n_obs * n_assets)
+    delta = (delta_ - 2 * mu * np.trace(emp_cov) + n_assets * mu ** 2) / n_assets
+    beta = min(beta, delta)
+    shrinkage = 0.0 if delta == 0 else beta / delta
+
+    shrunk = (1 - shrinkage) * emp_cov
+    shrunk.flat[::n_assets + 1] += shrinkage * mu
+    return shrunk
+
+def estimate_covariance(returns, method="auto"):
     """
-    Calculates weights for the growth assets that minimize total portfolio variance.
+    Covariance of a returns window (DataFrame or ndarray, rows = periods).
+    method: "sample", "ledoit_wolf", or "auto" (shrink only when the window is short for the universe).
     """
-    if not os.path.exists(REGIME_DATA):
-        return {"QQQ": 0.6, "SPY": 0.4} # Fallback
+    n_obs, n_assets = returns.shape
+    if method == "auto":
+        method = "sample" if n_obs >= SHRINKAGE_OBS_RATIO * n_assets else "ledoit_wolf"
+
+    if method == "ledoit_wolf":
+        return _ledoit_wolf(np.asarray(returns, dtype=np.float64))
+    if isinstance(returns, np.ndarray):
+        return np.atleast_2d(np.cov(returns, rowvar=False))
+    return returns.cov().values
+
+def _project_to_simplex(v):
+    """Euclidean projection onto {w >= 0, sum(w) = 1} (sort-based, O(k log k))."""
+    u = np.sort(v)[::-1]
+    css = np.cumsum(u) - 1
+    rho = np.nonzero(u * np.arange(1, len(v) + 1) > css)[0][-1]
+    theta = css[rho] / (rho + 1.0)
+    return np.maximum(v - theta, 0)
+
+def _min_variance_projected(cov_matrix):
+    """Accelerated projected gradient (FISTA) for long-only min variance: O(k^2) per iteration, no k^3 step."""
+    n_assets = len(cov_matrix)
+    # Gershgorin bound on the largest eigenvalue gives a safe step size
+    lipschitz = 2 * np.max(np.sum(np.abs(cov_matrix), axis=1))
+    if lipschitz <= 0:
+        return np.full(n_assets, 1.0 / n_assets)
+    step = 1.0 / lipschitz
+
+    w = np.full(n_assets, 1.0 / n_assets)
+    y, t = w.copy(), 1.0
+    for _ in range(PG_MAX_ITER):
+        w_next = _project_to_simplex(y - step * 2 * (cov_matrix @ y))
+        if np.max(np.abs(w_next - w)) < PG_TOLERANCE:
+            return w_next
+        # Adaptive restart: drop momentum once it points uphill
+        if np.dot(y - w_next, w_next - w) > 0:
+            t = 1.0
+        t_next = (1 + np.sqrt(1 + 4 * t * t)) / 2
+        y = w_next + ((t - 1) / t_next) * (w_next - w)
+        w, t = w_next, t_next
+    return w
 
-    df = pd.read_csv(REGIME_DATA)
+def solve_min_variance(cov_matrix, assets, cache=None):
+    """
+    Solves the long-only Minimum Variance problem for a given covariance matrix.
+    Uses accelerated projected gradient at every universe size: it is scale-free, so it still
+    converges on hourly covariances (~1e-6) where SLSQP's default ftol stops at the start point.
+    Results are memoized by (rounded covariance, asset list); returns None if the solver fails.
+    """
+    cache = get_default_cache() if cache is None else cache
+    key = make_cache_key(cov_matrix, assets, SOLVER_TAG)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    solution = _min_variance_projected(np.asarray(cov_matrix, dtype=np.float64))
+    if not np.all(np.isfinite(solution)):
+        return None
+
+    # Unrounded: per-asset rounding stops the weights summing to 1 once the universe grows (display code formats them)
+    weights = dict(zip(assets, solution))
+    cache.put(key, weights)
+    return weights
+
+def get_optimal_growth_weights(panel=None):
+    """
+    Calculates weights for the growth assets that minimize total portfolio variance.
+    Accepts an in-memory MarketPanel; otherwise reads the regime CSV.
+    """
     # We use the last 30 periods to capture recent volatility regimes
-    assets = ["QQQ", "SPY", "XLF", "XLU"]
-    available_assets = [a for a in assets if a in df.columns]
-    
-    # Calculate returns
-    returns = df[available_assets].pct_change().dropna().tail(30)
-    
-    if len(returns) < 10:
-        return {"QQQ": 0.6, "SPY": 0.4}
-
-    # Covariance Matrix
-    cov_matrix = returns.cov().values
-    
-    # Optimization Function: Minimize Variance
-    def portfolio_variance(weights):
-        return np.dot(weights.T, np.dot(cov_matrix, weights))
-
-    # Constraints: Weights must sum to 1
-    constraints = ({'type': 'eq', 'fun': lambda x: np.sum(x) - 1})
-    # Bounds: No short selling (0 to 1 per asset)
-    bounds = tuple((0, 1) for _ in range(len(available_assets)))
-    # Initial guess: Equal weights
-    init_guess = [1.0/len(available_assets)] * len(available_assets)
-
-    optimized = minimize(portfolio_variance, init_guess, 
-                         method='SLSQP', bounds=bounds, constraints=constraints)
-    
-    if not optimized.success:
-        return {"QQQ": 0.6, "SPY": 0.4}
+    assets = get_growth_assets()
+
+    if panel is not None:
+        available_assets = [a for a in assets if panel.has_ticker(a)]
+        returns = panel.returns[:, panel.ticker_index(available_assets)]
+        returns = returns[~np.isnan(returns).any(axis=1)][-30:]
+        if len(returns) < 10:
+            return default_growth_weights()
+        cov_matrix = estimate_covariance(returns)
+    else:
+        if not os.path.exists(REGIME_DATA):
+            return default_growth_weights() # Fallback
+
+        df = pd.read_csv(REGIME_DATA)
+        available_assets = [a for a in assets if a in df.columns]
+        
+        # Calculate returns
+        returns = df[available_assets].pct_change().dropna().tail(30)
+        
+        if len(returns) < 10:
+            return default_growth_weights()
+
+        # Covariance Matrix
+        cov_matrix = estimate_covariance(returns)
+
+    weights = solve_min_variance(cov_matrix, available_assets)
+    get_default_cache().flush()
+
+    if weights is None:
+        return default_growth_weights()
 
     # Return as a clean dictionary
-    return dict(zip(available_assets, np.round(optimized.x, 2)))
+    return weights
 
 if __name__ == "__main__":
     weights = get_optimal_growth_weights()
     print("Optimization Complete. Optimal Growth Mix:")
     for t, w in weights.items():
-        print(f"  {t}: {w*100:.0f}%")
\ No newline at end of file
+        print(f"  {t}: {w*100:.0f}%")
+    stats = get_cache_stats()
+    print(f"[INFO] Optimizer cache: {stats['hits']} hits / {stats['misses']} misses")
@@ -0,0 +1,160 @@
+import numpy as np
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+# Path Management
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+CACHE_PATH = os.path.join(BASE_DIR, "data", "cache", "optimizer_weights.json")
+
+# Constants
+COV_ROUND_DECIMALS = 10   # Hourly return covariances live around 1e-5 .. 1e-7
+MAX_MEMORY_ENTRIES = 512
+MAX_DISK_ENTRIES = 4096
+CACHE_FORMAT_VERSION = 3  # Bump to invalidate every stored result (3: weights stored unrounded)
+# Disk tier switch: "off" (or "0"/"false"/"none") keeps the cache in memory only; any other value is a cache file path
+CACHE_ENV_VAR = "SENTINEL_OPTIMIZER_CACHE"
+DISABLED_VALUES = {"off", "0", "false", "none", ""}
+
+
+def make_cache_key(cov_matrix, assets, solver_tag=""):
+    """
+    Hashes the rounded covariance matrix, the ordered asset list and a solver tag.
+    The tag names the solver and its settings, so results from an older solver are never served.
+    """
+    rounded = np.round(np.asarray(cov_matrix, dtype=np.float64), COV_ROUND_DECIMALS)
+    # Normalise -0.0 so that sign noise does not split identical windows
+    rounded = rounded + 0.0
+    digest = hashlib.sha1()
+    digest.update(f"v{CACHE_FORMAT_VERSION}|{solver_tag}|".encode("utf-8"))
+    digest.update("|".join(assets).encode("utf-8"))
+    digest.update(str(rounded.shape).encode("utf-8"))
+    digest.update(np.ascontiguousarray(rounded).tobytes())
+    return digest.hexdigest()
+
+
+class OptimizerCache:
+    """
+    Two-tier memo for optimizer results:
+    1. In-memory LRU (OrderedDict) for consecutive hours inside one run.
+    2. Optional JSON file on disk so reruns over unchanged history skip the solver.
+    Both tiers evict least-recently-used entries beyond their caps.
+    """
+
+    def __init__(self, max_entries=MAX_MEMORY_ENTRIES, persist_path=None, max_disk_entries=MAX_DISK_ENTRIES):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.persist_path = persist_path
+        self._memory = OrderedDict()
+        self._disk = None
+        self._disk_dirty = False
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _load_disk(self):
+        if self._disk is not None:
+            return self._disk
+        # JSON objects keep insertion order, which doubles as the LRU order on disk
+        self._disk = OrderedDict()
+        if self.persist_path and os.path.exists(self.persist_path):
+            try:
+                with open(self.persist_path, "r") as f:
+                    self._disk = OrderedDict(json.load(f))
+            except (OSError, ValueError) as e:
+                print(f"[WARNING] Optimizer cache unreadable, starting cold: {e}")
+            self._trim_disk()
+        return self._disk
+
+    def _trim_disk(self):
+        while len(self._disk) > self.max_disk_entries:
+            self._disk.popitem(last=False)
+            self._disk_dirty = True
+
+    def _remember(self, key, weights):
+        self._memory[key] = weights
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return dict(self._memory[key])
+
+        if self.persist_path:
+            disk = self._load_disk()
+            stored = disk.get(key)
+            if stored is not None:
+                disk.move_to_end(key)
+                self._disk_dirty = True
+                self._remember(key, stored)
+                self.hits += 1
+                self.disk_hits += 1
+                return dict(stored)
+
+        self.misses += 1
+        return None
+
+    def put(self, key, weights):
+        weights = {t: float(w) for t, w in weights.items()}
+        self._remember(key, weights)
+        if self.persist_path:
+            disk = self._load_disk()
+            disk[key] = weights
+            disk.move_to_end(key)
+            self._disk_dirty = True
+            self._trim_disk()
+
+    def flush(self):
+        """Writes the disk tier atomically (temp file + rename) so a killed run never leaves a torn cache."""
+        if not self.persist_path or not self._disk_dirty:
+            return
+        os.makedirs(os.path.dirname(self.persist_path), exist_ok=True)
+        tmp_path = self.persist_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._disk, f)
+        os.replace(tmp_path, self.persist_path)
+        self._disk_dirty = False
+
+    def clear(self):
+        self._memory.clear()
+        self._disk = OrderedDict() if self.persist_path else None
+        self._disk_dirty = bool(self.persist_path)
+        self.hits = self.disk_hits = self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_entries": len(self._disk) if self._disk is not None else 0,
+        }
+
+
+def default_persist_path():
+    """Disk tier location for the shared cache: CACHE_PATH unless overridden or disabled via SENTINEL_OPTIMIZER_CACHE."""
+    value = os.getenv(CACHE_ENV_VAR)
+    if value is None:
+        return CACHE_PATH
+    if value.strip().lower() in DISABLED_VALUES:
+        return None
+    return value if os.path.isabs(value) else os.path.join(BASE_DIR, value)
+
+
+# Shared instance used by the optimizer, the allocator and the backtest
+_default_cache = OptimizerCache(persist_path=default_persist_path())
+
+
+def get_default_cache():
+    return _default_cache
+
+
+def get_cache_stats():
+    return _default_cache.stats()
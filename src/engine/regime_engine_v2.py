@@ -10,6 +10,12 @@ MACRO_RAW = os.path.join(BASE_DIR, "data", "raw", "macro_indicators_raw.csv")
 SMOOTHED_NEWS = os.path.join(BASE_DIR, "data", "processed", "smoothed_indicators.csv")
 OUTPUT_PATH = os.path.join(BASE_DIR, "data", "processed", "regime_v2_status.csv")
 
+SRC_DIR = os.path.dirname(SCRIPT_DIR)
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+from engine.market_panel import MarketPanel
+
 def calculate_rsi(series, period=14):
     """Calculates the 14-period RSI Speedometer"""
     series = pd.to_numeric(series, errors='coerce')
@@ -61,14 +67,24 @@ def determine_regime_v2():
 
     regimes = []
     
+    # Hot-loop inputs pulled out once as flat arrays (missing columns default as before)
+    def column_or(name, default):
+        if name in combined.columns:
+            return combined[name].to_numpy(dtype=np.float64)
+        return np.full(len(combined), default, dtype=np.float64)
+
+    rsi_values = column_or('RSI', 50)
+    liq_values = column_or('Real_Liquidity', 0)
+    labor_values = column_or('Labor_Market', 0)
+    manuf_values = column_or('Manufacturing', 0)
+    
     # 5. DECISION TREE
     for i in range(len(combined)):
-        row = combined.iloc[i]
-        rsi = row.get('RSI', 50)
-        real_liq = row.get('Real_Liquidity', 0)
+        rsi = rsi_values[i]
+        real_liq = liq_values[i]
         
         # Growth Pulse
-        growth_pulse = (row.get('Labor_Market', 0) * 0.6) + (row.get('Manufacturing', 0) * 0.4)
+        growth_pulse = (labor_values[i] * 0.6) + (manuf_values[i] * 0.4)
         
         # --- THE UPGRADE: LIQUIDITY VETO ---
         # If Real Liquidity is negative, the Fed is draining money.
@@ -96,5 +112,8 @@ def determine_regime_v2():
     liq_status = "CRUNCH" if combined['Real_Liquidity'].iloc[-1] < -1.0 else "NORMAL"
     print(f"[SUCCESS] Regime Engine V2 Updated. Liquidity: {combined['Real_Liquidity'].iloc[-1]:.2f}% [{liq_status}]")
 
+    # Hand the typed grid straight to downstream engines (no CSV re-parse needed)
+    return MarketPanel.from_frame(combined.rename_axis("Timestamp").reset_index())
+
 if __name__ == "__main__":
     determine_regime_v2()
\ No newline at end of file
@@ -1,5 +1,5 @@
-import pandas as pd
 import os
+import sys
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 # 1. Environment-Agnostic Path Management
@@ -8,13 +8,21 @@ BASE_DIR = os.path.dirname(os.path.dirname(SCRIPT_DIR))
 INPUT_PATH = os.path.join(BASE_DIR, "data", "raw", "news_stream_history.csv")
 OUTPUT_PATH = os.path.join(BASE_DIR, "data", "processed", "smoothed_indicators.csv")
 
-def smooth_signals():
-    if not os.path.exists(INPUT_PATH):
-        print(f"[ERROR] No stream history found at {INPUT_PATH}. Run news_collector.py first.")
+SRC_DIR = os.path.dirname(SCRIPT_DIR)
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+from collectors.stream_log import read_stream, ensure_log, LOG_PATH
+
+def smooth_signals(start=None, end=None):
+    """Smooths the news stream; `start`/`end` slice the log by Timestamp without reading the rest."""
+    ensure_log(LOG_PATH, INPUT_PATH)
+    if not os.path.exists(LOG_PATH):
+        print(f"[ERROR] No stream history found at {LOG_PATH}. Run news_collector.py first.")
         return
 
     print("[INFO] Processing sentiment trends from stream history...")
-    df = pd.read_csv(INPUT_PATH, parse_dates=['Timestamp'])
+    df = read_stream(start, end)
     
     # 2. Advanced NLP Conviction Scoring
     if 'Headline' in df.columns:
@@ -0,0 +1,99 @@
+import json
+import os
+
+# Path Management
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+
+# Optional override: path to a JSON file with any of the keys below
+UNIVERSE_ENV_VAR = "SENTINEL_UNIVERSE"
+
+# Default Strategy Map universe
+# - market:    tickers harvested on the hourly grid and backtested
+# - growth:    candidates for the Minimum Variance optimizer (also hit by the VIX governor)
+# - core:      [primary, secondary] equity pair used by the fixed regime mixes and fallbacks
+# - defensive: cash-like parking asset
+# - benchmark: buy-and-hold reference for the backtest reports
+# - watchlist: extra tickers shown by the price tracker only
+DEFAULT_UNIVERSE = {
+    "market": ["SPY", "QQQ", "GLD", "SHY", "XLF", "XLU"],
+    "growth": ["QQQ", "SPY", "XLF", "XLU"],
+    "core": ["QQQ", "SPY"],
+    "defensive": "SHY",
+    "benchmark": "SPY",
+    "watchlist": ["XLE", "TLT", "DBC"],
+}
+
+_universe = None
+
+
+def _dedupe(tickers):
+    seen = set()
+    return [t for t in tickers if not (t in seen or seen.add(t))]
+
+
+def load_universe(path=None):
+    """
+    Loads the ticker universe. Keys missing from the override file keep their defaults;
+    growth, core, defensive and benchmark tickers are always folded into the market list.
+    """
+    universe = {k: (list(v) if isinstance(v, list) else v) for k, v in DEFAULT_UNIVERSE.items()}
+    path = path or os.getenv(UNIVERSE_ENV_VAR)
+
+    if path:
+        if not os.path.isabs(path):
+            path = os.path.join(BASE_DIR, path)
+        try:
+            with open(path, "r") as f:
+                overrides = json.load(f)
+            universe.update({k: v for k, v in overrides.items() if k in DEFAULT_UNIVERSE})
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] Could not load universe from {path}, using defaults: {e}")
+
+    universe["growth"] = _dedupe(t.upper() for t in universe["growth"])
+    core = _dedupe(t.upper() for t in universe["core"])
+    if len(core) != 2:
+        print(f"[WARNING] Universe 'core' must name exactly two tickers, got {core}; using defaults.")
+        core = list(DEFAULT_UNIVERSE["core"])
+    universe["core"] = core
+    universe["defensive"] = universe["defensive"].upper()
+    universe["benchmark"] = universe["benchmark"].upper()
+    universe["market"] = _dedupe([t.upper() for t in universe["market"]]
+                                 + universe["growth"] + core + [universe["defensive"], universe["benchmark"]])
+    universe["watchlist"] = _dedupe(t.upper() for t in universe["watchlist"])
+    return universe
+
+
+def get_universe():
+    global _universe
+    if _universe is None:
+        _universe = load_universe()
+    return _universe
+
+
+def get_market_tickers():
+    return list(get_universe()["market"])
+
+
+def get_growth_assets():
+    return list(get_universe()["growth"])
+
+
+def get_core_assets():
+    """(primary, secondary) equity pair for the fixed regime mixes."""
+    primary, secondary = get_universe()["core"]
+    return primary, secondary
+
+
+def get_defensive_asset():
+    return get_universe()["defensive"]
+
+
+def get_benchmark_asset():
+    return get_universe()["benchmark"]
+
+
+def get_tracked_tickers():
+    """Market tickers plus the watchlist, for live price display."""
+    u = get_universe()
+    return _dedupe(u["market"] + u["watchlist"])
@@ -10,51 +10,57 @@ if SRC_DIR not in sys.path:
     sys.path.append(SRC_DIR)
 
 from engine.optimizer import get_optimal_growth_weights
+from engine.market_panel import MarketPanel
+from portfolio.price_service import get_quotes
+from engine.universe import get_core_assets, get_defensive_asset
 
 # Path Management for Data
 BASE_DIR = os.path.dirname(SRC_DIR)
 REGIME_DATA = os.path.join(BASE_DIR, "data", "processed", "regime_v2_status.csv")
 PORTFOLIO_OUTPUT = os.path.join(BASE_DIR, "data", "processed", "target_allocation.csv")
 
-# Static Allocation Map for Defensive and Transitional States
+# Static Allocation Map for Defensive and Transitional States (tickers from the configured universe)
+PRIMARY, SECONDARY = get_core_assets()
+DEFENSIVE = get_defensive_asset()
+
 ALLOCATION_MAP = {
     "Goldilocks (Overbought - Trim)": {
         "Strategy": "Tactical De-risking",
-        "Primary_ETF": "SHY",
-        "Allocation": {"SHY": 0.60, "QQQ": 0.20, "SPY": 0.20}
+        "Primary_ETF": DEFENSIVE,
+        "Allocation": {DEFENSIVE: 0.60, PRIMARY: 0.20, SECONDARY: 0.20}
     },
     "Goldilocks (Oversold - Opportunity)": {
         "Strategy": "Aggressive Re-entry",
-        "Primary_ETF": "QQQ",
-        "Allocation": {"QQQ": 0.70, "SPY": 0.30}
+        "Primary_ETF": PRIMARY,
+        "Allocation": {PRIMARY: 0.70, SECONDARY: 0.30}
     },
     "Neutral / Transitioning": {
         "Strategy": "Capital Preservation",
-        "Primary_ETF": "SHY",
-        "Allocation": {"SHY": 1.0}
+        "Primary_ETF": DEFENSIVE,
+        "Allocation": {DEFENSIVE: 1.0}
     },
     "Liquidity Crunch (Defensive)": {
         "Strategy": "Nuclear Safety",
-        "Primary_ETF": "SHY",
-        "Allocation": {"SHY": 1.0}
+        "Primary_ETF": DEFENSIVE,
+        "Allocation": {DEFENSIVE: 1.0}
     }
 }
 
-def generate_allocation():
-    if not os.path.exists(REGIME_DATA):
-        print("[ERROR] No regime data found. Ensure the regime engine has been executed.")
-        return
+def generate_allocation(panel=None):
+    if panel is None:
+        if not os.path.exists(REGIME_DATA):
+            print("[ERROR] No regime data found. Ensure the regime engine has been executed.")
+            return
+        # 1. Load latest market state
+        panel = MarketPanel.from_csv(REGIME_DATA)
 
-    # 1. Load latest market state
-    df = pd.read_csv(REGIME_DATA)
-    latest_row = df.iloc[-1]
-    latest_regime = latest_row['Regime_V2']
+    latest_regime = panel.regime_label(-1)
     
     # 2. Dynamic Allocation Logic via Optimization
     if latest_regime == "Goldilocks (Growth)":
         print("System State: Growth detected. Initializing Mean-Variance Optimizer...")
-        # Call the optimizer to find the Minimum Variance mix of QQQ, SPY, XLF, and XLU
-        opt_weights = get_optimal_growth_weights()
+        # Call the optimizer to find the Minimum Variance mix of the configured growth assets
+        opt_weights = get_optimal_growth_weights(panel)
         
         config = {
             "Strategy": "Optimized Minimum Variance Growth",
@@ -75,15 +81,26 @@ def generate_allocation():
     print("-" * 45)
     print("Final Portfolio Weights:")
     
+    # Live quotes for the active positions (cached service; the report still runs offline)
+    active = [t for t, w in config['Allocation'].items() if w > 0]
+    try:
+        quotes = get_quotes(active)
+    except Exception as e:
+        print(f"[WARNING] Live quotes unavailable: {e}")
+        quotes = None
+
     output_rows = []
     for ticker, weight in config['Allocation'].items():
         if weight > 0: # Only record active positions
-            print(f"  {ticker.ljust(5)}: {weight*100:>3.0f}%")
+            price = quotes.at[ticker, 'Price'] if quotes is not None and ticker in quotes.index else None
+            price_str = f"  @ {price:.2f}" if price is not None else ""
+            print(f"  {ticker.ljust(5)}: {weight*100:>3.0f}%{price_str}")
             output_rows.append({
                 "Ticker": ticker,
                 "Weight": weight,
                 "Regime": latest_regime,
-                "Strategy": config['Strategy']
+                "Strategy": config['Strategy'],
+                "Last_Price": price
             })
 
     # 4. Persistence to CSV
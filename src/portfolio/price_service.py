@@ -0,0 +1,184 @@
+import pandas as pd
+import os
+import sys
+import time
+
+# Path Management
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.dirname(SCRIPT_DIR)
+BASE_DIR = os.path.dirname(SRC_DIR)
+
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+from engine.universe import get_tracked_tickers
+
+# Constants
+QUOTE_TTL_SECONDS = 60.0
+# Point this at a CSV (Ticker, Price, Prev_Close or Change_Pct) to run without network access
+PRICE_FILE_ENV_VAR = "SENTINEL_PRICE_FILE"
+
+
+class YFinanceProvider:
+    """Batched Yahoo Finance quotes: one request per refresh, however many tickers are stale."""
+
+    def fetch_latest(self, tickers):
+        """{ticker: (price, session_date)}; the session is the exchange date of the latest minute bar."""
+        import yfinance as yf
+        data = self._as_frame(yf.download(tickers, period="1d", interval="1m", progress=False)['Close'], tickers)
+        out = {}
+        for t in tickers:
+            if t in data.columns:
+                series = data[t].dropna()
+                if len(series):
+                    out[t] = (float(series.iloc[-1]), series.index[-1].strftime("%Y-%m-%d"))
+        return out
+
+    def fetch_prev_close(self, sessions):
+        """{ticker: close of the last daily bar strictly before that ticker's session date}."""
+        import yfinance as yf
+        tickers = list(sessions)
+        data = self._as_frame(yf.download(tickers, period="5d", interval="1d", progress=False)['Close'], tickers)
+        out = {}
+        for t, session in sessions.items():
+            if t in data.columns:
+                series = data[t].dropna()
+                series = series[series.index.strftime("%Y-%m-%d") < session]
+                if len(series):
+                    out[t] = float(series.iloc[-1])
+        return out
+
+    @staticmethod
+    def _as_frame(data, tickers):
+        if isinstance(data, pd.Series):
+            data = data.to_frame(name=tickers[0])
+        return data
+
+
+class FileProvider:
+    """
+    Local stand-in provider backed by a CSV snapshot (e.g. live_prices.csv); used for tests/offline runs.
+    Optional columns: Prev_Close (else derived from Change_Pct) and Session (else FILE_SESSION).
+    """
+
+    FILE_SESSION = "snapshot"
+
+    def __init__(self, path):
+        self.path = path
+        self.calls = 0
+        self.requests = []  # (method, tickers) per provider call, to check batching
+
+    def _load(self):
+        df = pd.read_csv(self.path, index_col=0)
+        if 'Prev_Close' not in df.columns and 'Change_Pct' in df.columns:
+            df['Prev_Close'] = df['Price'] / (1 + df['Change_Pct'] / 100)
+        return df
+
+    def fetch_latest(self, tickers):
+        self.calls += 1
+        self.requests.append(("latest", list(tickers)))
+        df = self._load()
+        return {t: (float(df.at[t, 'Price']),
+                    str(df.at[t, 'Session']) if 'Session' in df.columns else self.FILE_SESSION)
+                for t in tickers if t in df.index}
+
+    def fetch_prev_close(self, sessions):
+        self.calls += 1
+        self.requests.append(("prev_close", list(sessions)))
+        df = self._load()
+        return {t: float(df.at[t, 'Prev_Close']) for t in sessions
+                if t in df.index and 'Prev_Close' in df.columns}
+
+
+class PriceService:
+    """
+    Per-ticker quote cache with a staleness TTL.
+    Only stale tickers are refreshed, in one batched provider call. Prior closes are cached
+    per trading session (the date of the latest bar), so they are refetched only when a new
+    session starts. Tickers the provider has no quote for are cached as misses under the same TTL;
+    a missing prior close is not cached, so it is retried on the ticker's next (TTL-driven) refresh.
+    """
+
+    def __init__(self, provider=None, ttl=QUOTE_TTL_SECONDS, clock=time.time):
+        self.provider = provider or YFinanceProvider()
+        self.ttl = ttl
+        self.clock = clock
+        self._quotes = {}       # ticker -> {"Price" (None = miss), "Session", "Fetched_At"}
+        self._prev_close = {}   # ticker -> (session, prev_close); hits only
+
+    def stale_tickers(self, tickers, now=None):
+        now = self.clock() if now is None else now
+        return [t for t in tickers
+                if t not in self._quotes or now - self._quotes[t]["Fetched_At"] >= self.ttl]
+
+    def refresh(self, tickers, force=False):
+        now = self.clock()
+        stale = list(tickers) if force else self.stale_tickers(tickers, now)
+        if not stale:
+            return []
+
+        latest = self.provider.fetch_latest(stale)
+        for t in stale:
+            price, session = latest.get(t, (None, None))
+            self._quotes[t] = {"Price": price, "Session": session, "Fetched_At": now}
+
+        # Prior close only when the ticker has moved into a session we have not seen yet
+        need_prev = {t: session for t, (_, session) in latest.items()
+                     if self._prev_close.get(t, (None,))[0] != session}
+        if need_prev:
+            closes = self.provider.fetch_prev_close(need_prev)
+            for t, session in need_prev.items():
+                if closes.get(t) is not None:
+                    self._prev_close[t] = (session, closes[t])
+        return stale
+
+    def get_quotes(self, tickers=None):
+        """Fresh quotes as a DataFrame indexed by Ticker with Price and Change_Pct (live_prices.csv layout)."""
+        tickers = list(tickers) if tickers is not None else get_tracked_tickers()
+        self.refresh(tickers)
+
+        rows = {}
+        for t in tickers:
+            quote = self._quotes.get(t)
+            if quote is None or quote["Price"] is None:
+                continue
+            prev = self._prev_close.get(t, (None, None))[1]
+            change = ((quote["Price"] - prev) / prev) * 100 if prev else float("nan")
+            rows[t] = {"Price": quote["Price"], "Change_Pct": change}
+
+        quotes = pd.DataFrame.from_dict(rows, orient="index", columns=["Price", "Change_Pct"])
+        quotes.index.name = "Ticker"
+        return quotes
+
+    def get_price(self, ticker):
+        quotes = self.get_quotes([ticker])
+        return float(quotes.at[ticker, "Price"]) if ticker in quotes.index else None
+
+    def invalidate(self, tickers=None):
+        for t in (tickers if tickers is not None else list(self._quotes)):
+            self._quotes.pop(t, None)
+
+
+def _default_provider():
+    price_file = os.getenv(PRICE_FILE_ENV_VAR)
+    if price_file:
+        return FileProvider(price_file)
+    return YFinanceProvider()
+
+
+_default_service = None
+
+
+def get_price_service():
+    global _default_service
+    if _default_service is None:
+        _default_service = PriceService(provider=_default_provider())
+    return _default_service
+
+
+def get_quotes(tickers=None):
+    return get_price_service().get_quotes(tickers)
+
+
+def get_price(ticker):
+    return get_price_service().get_price(ticker)
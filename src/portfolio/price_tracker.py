@@ -1,29 +1,29 @@
-import pandas as pd
-import yfinance as yf
 import os
+import sys
 
 # Path Management
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-BASE_DIR = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+SRC_DIR = os.path.dirname(SCRIPT_DIR)
+BASE_DIR = os.path.dirname(SRC_DIR)
 PRICE_DATA_PATH = os.path.join(BASE_DIR, "data", "processed", "live_prices.csv")
 
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+from engine.universe import get_tracked_tickers
+from portfolio.price_service import get_quotes
+
 def track_prices():
-    # The core assets we mapped in our Allocator
-    tickers = ["QQQ", "SPY", "XLE", "GLD", "TLT", "DBC", "XLU", "SHY"]
+    # Strategy universe plus the display-only watchlist
+    tickers = get_tracked_tickers()
     
     print(f"[INFO] Fetching live market prices for {len(tickers)} assets...")
     
     try:
-        # Fetch last 5 days of data to ensure we get the latest close
-        data = yf.download(tickers, period="5d", interval="1d")['Close']
-        
-        # Get the most recent non-null price for each
-        latest_prices = data.iloc[-1].to_frame(name="Price")
-        
-        # Calculate 24h Change %
-        prev_prices = data.iloc[-2]
-        latest_prices['Change_Pct'] = ((latest_prices['Price'] - prev_prices) / prev_prices) * 100
+        # Cached quotes: only stale tickers are refreshed, in one batched request
+        latest_prices = get_quotes(tickers).sort_index()
         
+        # Snapshot kept for the workflow commit and offline runs
         os.makedirs(os.path.dirname(PRICE_DATA_PATH), exist_ok=True)
         latest_prices.to_csv(PRICE_DATA_PATH)
         print(f"[SUCCESS] Live prices saved to {PRICE_DATA_PATH}")
@@ -32,4 +32,4 @@ def track_prices():
         print(f"[ERROR] Price fetch failed: {e}")
 
 if __name__ == "__main__":
-    track_prices()
\ No newline at end of file
+    track_prices()
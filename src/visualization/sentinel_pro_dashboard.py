@@ -29,7 +29,10 @@ def generate_pro_dashboard():
 
     # --- PLOT 1: PRECISION EQUITY CURVE & REGIMES ---
     ax1.plot(df['Timestamp'], df['Strategy_Value'], label='Macro Sentinel (Strategy)', color='#2E86C1', linewidth=3)
-    ax1.plot(df['Timestamp'], df['Benchmark_Value'], label='S&P 500 (Benchmark)', color='#5D6D7E', alpha=0.5, linestyle='--')
+    value_cols = ['Strategy_Value']
+    if 'Benchmark_Value' in df.columns:
+        ax1.plot(df['Timestamp'], df['Benchmark_Value'], label='Benchmark', color='#5D6D7E', alpha=0.5, linestyle='--')
+        value_cols.append('Benchmark_Value')
 
     # Color coded Regime Underlays
     regime_colors = {
@@ -44,7 +47,7 @@ def generate_pro_dashboard():
         if mask.any():
             ax1.fill_between(df['Timestamp'], 0.5, 1.5, where=mask, color=color, alpha=0.5, label=f'Regime: {regime}')
 
-    ax1.set_ylim(df[['Strategy_Value', 'Benchmark_Value']].min().min()*0.98, 1.05)
+    ax1.set_ylim(df[value_cols].min().min()*0.98, 1.05)
     ax1.set_title('MacroSentinel: Performance vs. Market Regimes', fontsize=20, fontweight='bold', pad=20)
     ax1.set_ylabel('Normalized Portfolio Value', fontsize=12)
     ax1.legend(loc='upper left', frameon=True, facecolor='white', fontsize=10)
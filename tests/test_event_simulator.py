@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from backtest.event_simulator import run_event_simulation
+from backtest.performance_engine import run_hourly_loop
+from engine.market_panel import MarketPanel
+
+REGIMES = ["Goldilocks (Growth)", "Goldilocks (Oversold - Opportunity)", "Neutral / Transitioning"]
+TICKERS = ["SPY", "QQQ", "GLD", "SHY", "XLF", "XLU"]
+
+
+def make_panel(n=60, seed=7, duplicate_at=None):
+    rng = np.random.default_rng(seed)
+    rets = rng.normal(0, 0.004, size=(n - 1, len(TICKERS)))
+    prices = 100 * np.vstack([np.ones((1, len(TICKERS))), np.cumprod(1 + rets, axis=0)])
+
+    index = np.datetime64("2026-02-11T14:00", "ns") + np.arange(n) * np.timedelta64(1, "h")
+    if duplicate_at is not None:
+        index[duplicate_at + 1] = index[duplicate_at]
+
+    # Regime blocks of 8 bars; VIX crosses the governor threshold in the middle of the run
+    codes = (np.arange(n) // 8) % len(REGIMES)
+    vix = np.where((np.arange(n) > 20) & (np.arange(n) < 35), 24.0, 16.0)
+    return MarketPanel(index=index, tickers=TICKERS, prices=prices,
+                       macro_columns=["VIX_Index"], macro=vix[:, None],
+                       regime_labels=REGIMES, regime_codes=codes)
+
+
+def test_duplicate_timestamps_do_not_change_results():
+    base = run_event_simulation(make_panel(), write_report=False)
+    for dup in (5, 30, 57):
+        dup_df = run_event_simulation(make_panel(duplicate_at=dup), write_report=False)
+        np.testing.assert_array_equal(dup_df["Strategy_Value"].to_numpy(), base["Strategy_Value"].to_numpy())
+        np.testing.assert_array_equal(dup_df["Trades"].to_numpy(), base["Trades"].to_numpy())
+
+
+def test_frictionless_simulation_matches_hourly_loop():
+    panel = make_panel()
+    strat_rets, _ = run_hourly_loop(panel, friction_cost=0.0)
+    loop_value = np.cumprod(1 + np.asarray(strat_rets, dtype=float))
+
+    event_df = run_event_simulation(panel, no_trade_band=0.0, cost_per_turnover=0.0, write_report=False)
+    np.testing.assert_allclose(event_df["Strategy_Value"].to_numpy(), loop_value, rtol=0, atol=1e-12)
+
+
+def test_costs_scale_with_turnover():
+    panel = make_panel()
+    free = run_event_simulation(panel, no_trade_band=0.0, cost_per_turnover=0.0, write_report=False)
+    costly = run_event_simulation(panel, no_trade_band=0.0, cost_per_turnover=0.001, write_report=False)
+
+    assert costly["Trading_Cost"].sum() == pytest.approx(0.001 * free["Turnover"].sum(), rel=0.05)
+    assert costly["Strategy_Value"].iloc[-1] < free["Strategy_Value"].iloc[-1]
+
+
+def test_no_trade_band_suppresses_small_rebalances():
+    panel = make_panel()
+    tight = run_event_simulation(panel, no_trade_band=0.0, write_report=False)
+    banded = run_event_simulation(panel, no_trade_band=0.05, write_report=False)
+    assert banded["Trades"].sum() < tight["Trades"].sum()
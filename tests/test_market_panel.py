@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.market_panel import MarketPanel
+
+TICKERS = ["SPY", "QQQ", "SHY"]
+REGIMES = ["Goldilocks (Growth)", "Neutral / Transitioning", None]
+
+
+def make_frame(n=40, seed=0, tz=None):
+    rng = np.random.default_rng(seed)
+    ts = pd.date_range("2026-02-10 09:00:00.442708", periods=n, freq="h", tz=tz).as_unit("ns")
+    prices = 100 * np.cumprod(1 + rng.normal(scale=0.01, size=(n, len(TICKERS))), axis=0)
+    df = pd.DataFrame({"Timestamp": ts, "VIX_Index": rng.uniform(12, 30, n)})
+    # Tickers deliberately interleaved with macro columns to check column order
+    df["SPY"] = prices[:, 0]
+    df["RSI"] = rng.uniform(20, 80, n)
+    df["QQQ"] = prices[:, 1]
+    df["SHY"] = prices[:, 2]
+    df["Regime_V2"] = [REGIMES[k % len(REGIMES)] for k in range(n)]
+    return df
+
+
+def test_round_trip_preserves_columns_values_and_regimes():
+    df = make_frame()
+    out = MarketPanel.from_frame(df, tickers=TICKERS).to_frame()
+
+    assert list(out.columns) == list(df.columns)
+    pd.testing.assert_frame_equal(out.drop(columns="Regime_V2"), df.drop(columns="Regime_V2"))
+    # Missing regimes come back as missing (code -1), not as a label
+    assert out["Regime_V2"].isna().tolist() == df["Regime_V2"].isna().tolist()
+    assert out["Regime_V2"].dropna().tolist() == df["Regime_V2"].dropna().tolist()
+
+
+def test_csv_output_is_byte_identical_to_dataframe_path(tmp_path):
+    path = tmp_path / "regime.csv"
+    make_frame().to_csv(path, index=False)
+    panel = MarketPanel.from_csv(path, tickers=TICKERS)
+
+    assert panel.to_frame().to_csv(index=False) == pd.read_csv(path).to_csv(index=False)
+
+
+def test_regime_codes_and_labels():
+    panel = MarketPanel.from_frame(make_frame(), tickers=TICKERS)
+    assert panel.regime_codes.dtype == np.int8
+    assert panel.regime_codes[2] == -1
+    assert panel.regime_label(2) is None
+    assert panel.regime_label(0) == "Goldilocks (Growth)"
+    assert panel.regime_code("Goldilocks (Growth)") == panel.regime_codes[0]
+    assert panel.regime_code("Never Seen") == -1
+
+
+def test_timezone_is_stripped_and_rows_sorted():
+    df = make_frame(tz="UTC")
+    shuffled = df.iloc[np.random.default_rng(1).permutation(len(df))]
+    panel = MarketPanel.from_frame(shuffled, tickers=TICKERS)
+
+    assert panel.index.dtype == np.dtype("datetime64[ns]")
+    np.testing.assert_array_equal(panel.index, df["Timestamp"].dt.tz_localize(None).to_numpy())
+    np.testing.assert_array_equal(panel.price("QQQ"), df["QQQ"].to_numpy())
+
+
+def test_returns_align_with_pandas():
+    df = make_frame()
+    panel = MarketPanel.from_frame(df, tickers=TICKERS)
+    expected = df[TICKERS].pct_change()
+
+    np.testing.assert_allclose(panel.returns, expected.to_numpy(), rtol=1e-12, equal_nan=True)
+    np.testing.assert_allclose(panel.forward_returns, expected.shift(-1).to_numpy()[:-1], rtol=1e-12)
+
+
+@pytest.mark.parametrize("end, length", [(30, 30), (10, 30), (39, 5)])
+def test_window_covers_trailing_rows_inclusive(end, length):
+    df = make_frame()
+    panel = MarketPanel.from_frame(df, tickers=TICKERS)
+    expected = df[TICKERS].pct_change().iloc[max(end - length, 0):end + 1]
+
+    np.testing.assert_allclose(panel.window(end, length), expected.to_numpy(), rtol=1e-12, equal_nan=True)
+    np.testing.assert_allclose(panel.window(end, length, ["QQQ", "SPY"]),
+                               expected[["QQQ", "SPY"]].to_numpy(), rtol=1e-12, equal_nan=True)
+
+
+def test_views_share_memory():
+    panel = MarketPanel.from_frame(make_frame(), tickers=TICKERS)
+
+    assert np.shares_memory(panel.price("SPY"), panel.prices)
+    assert np.shares_memory(panel.macro_series("VIX_Index"), panel.macro)
+    assert np.shares_memory(panel.forward_returns, panel.returns)
+    assert np.shares_memory(panel.window(20, 10), panel.returns)
+    assert panel.returns is panel.returns  # computed once
+    # A ticker subset copies only the window
+    assert not np.shares_memory(panel.window(20, 10, ["SPY"]), panel.returns)
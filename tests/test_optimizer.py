@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from engine.optimizer import (
+    _ledoit_wolf, _min_variance_projected, _project_to_simplex, estimate_covariance, solve_min_variance,
+)
+from engine.optimizer_cache import OptimizerCache
+
+
+def hourly_window(k, n_obs=30, seed=0):
+    """Correlated returns at hourly scale (covariances ~1e-6)."""
+    rng = np.random.default_rng(seed)
+    factor = rng.normal(scale=1e-3, size=(n_obs, 1))
+    return factor * rng.uniform(0.5, 1.5, size=k) + rng.normal(scale=1e-3, size=(n_obs, k))
+
+
+@pytest.mark.parametrize("k", [4, 20, 120])
+def test_weights_are_fully_invested(k):
+    cov = np.cov(hourly_window(k, n_obs=max(30, 3 * k)), rowvar=False)
+    assets = [f"A{j}" for j in range(k)]
+    weights = solve_min_variance(cov, assets, cache=OptimizerCache())
+
+    assert list(weights) == assets
+    assert sum(weights.values()) == pytest.approx(1.0, abs=1e-9)
+    assert min(weights.values()) >= 0
+
+
+def test_ledoit_wolf_matches_sklearn():
+    sklearn_cov = pytest.importorskip("sklearn.covariance")
+    returns = hourly_window(120)
+    np.testing.assert_allclose(_ledoit_wolf(returns), sklearn_cov.ledoit_wolf(returns)[0],
+                               rtol=1e-10, atol=1e-20)
+
+
+def test_estimate_covariance_auto_switches_to_shrinkage():
+    short = hourly_window(20, n_obs=30)
+    long = hourly_window(4, n_obs=30)
+    np.testing.assert_allclose(estimate_covariance(short), _ledoit_wolf(short))
+    np.testing.assert_allclose(estimate_covariance(long), np.cov(long, rowvar=False))
+    # DataFrame and ndarray inputs agree
+    pd = pytest.importorskip("pandas")
+    np.testing.assert_allclose(estimate_covariance(pd.DataFrame(long)), estimate_covariance(long))
+
+
+@pytest.mark.parametrize("v", [
+    np.array([0.2, 0.3, 0.5]),          # already on the simplex
+    np.array([3.0, -1.0, 0.5, 0.1]),
+    np.array([-2.0, -2.0, -2.0]),
+    np.random.default_rng(3).normal(size=50),
+])
+def test_project_to_simplex(v):
+    w = _project_to_simplex(v)
+    assert w.sum() == pytest.approx(1.0)
+    assert w.min() >= 0
+    # Optimality: (v - w) . (u - w) <= 0 for every vertex u of the simplex
+    assert np.max(v - w) <= np.dot(v - w, w) + 1e-12
+
+
+@pytest.mark.parametrize("k", [4, 20, 120])
+def test_projected_gradient_matches_converged_slsqp(k):
+    optimize = pytest.importorskip("scipy.optimize")
+    cov = estimate_covariance(hourly_window(k))
+
+    w = _min_variance_projected(cov)
+
+    # SLSQP only converges tightly once the problem is rescaled to O(1)
+    scaled = cov / np.trace(cov) * k
+    ref = optimize.minimize(lambda x: x @ scaled @ x, np.full(k, 1.0 / k), jac=lambda x: 2 * scaled @ x,
+                            method="SLSQP", bounds=[(0, 1)] * k,
+                            constraints={"type": "eq", "fun": lambda x: x.sum() - 1},
+                            options={"ftol": 1e-15, "maxiter": 1000}).x
+
+    assert w @ cov @ w <= ref @ cov @ ref * (1 + 1e-6)
+    np.testing.assert_allclose(w, ref, atol=1e-4)
+
+
+def test_zero_covariance_falls_back_to_equal_weights():
+    np.testing.assert_array_equal(_min_variance_projected(np.zeros((4, 4))), np.full(4, 0.25))
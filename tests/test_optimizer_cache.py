@@ -0,0 +1,115 @@
+import json
+
+import numpy as np
+import pytest
+
+import engine.optimizer_cache as optimizer_cache
+from engine.optimizer_cache import OptimizerCache, make_cache_key
+
+ASSETS = ["QQQ", "SPY", "XLF"]
+
+
+def weights(k):
+    return {"QQQ": k / 10, "SPY": 1 - k / 10, "XLF": 0.0}
+
+
+@pytest.fixture
+def cov():
+    rng = np.random.default_rng(0)
+    x = rng.normal(scale=1e-3, size=(30, len(ASSETS)))
+    return np.cov(x, rowvar=False)
+
+
+def test_memory_lru_evicts_least_recently_used():
+    cache = OptimizerCache(max_entries=2)
+    cache.put("a", weights(1))
+    cache.put("b", weights(2))
+    assert cache.get("a") == weights(1)   # "a" is now most recent
+    cache.put("c", weights(3))            # evicts "b"
+
+    assert cache.get("b") is None
+    assert cache.get("a") == weights(1)
+    assert cache.get("c") == weights(3)
+    assert cache.stats()["memory_entries"] == 2
+
+
+def test_counters_track_hits_disk_hits_and_misses(tmp_path):
+    path = str(tmp_path / "weights.json")
+    writer = OptimizerCache(persist_path=path)
+    writer.put("a", weights(1))
+    writer.flush()
+
+    reader = OptimizerCache(persist_path=path)
+    assert reader.get("missing") is None
+    assert reader.get("a") == weights(1)   # from disk
+    assert reader.get("a") == weights(1)   # now from memory
+
+    stats = reader.stats()
+    assert (stats["hits"], stats["disk_hits"], stats["misses"]) == (2, 1, 1)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    reader.clear()
+    assert (reader.hits, reader.disk_hits, reader.misses) == (0, 0, 0)
+
+
+def test_disk_round_trip_and_trim(tmp_path):
+    path = str(tmp_path / "weights.json")
+    cache = OptimizerCache(max_entries=1, persist_path=path, max_disk_entries=3)
+    for k in range(5):
+        cache.put(f"k{k}", weights(k))
+    cache.flush()
+
+    with open(path) as f:
+        stored = json.load(f)
+    assert list(stored) == ["k2", "k3", "k4"]
+
+    reloaded = OptimizerCache(persist_path=path, max_disk_entries=3)
+    assert reloaded.get("k0") is None
+    assert reloaded.get("k3") == weights(3)
+    assert reloaded.stats()["disk_entries"] == 3
+
+    # Loading a file larger than the cap trims it to the most recent entries
+    smaller = OptimizerCache(persist_path=path, max_disk_entries=2)
+    assert smaller.get("k2") is None
+    assert smaller.get("k4") == weights(4)
+
+
+def test_flush_is_a_noop_without_changes(tmp_path):
+    path = tmp_path / "weights.json"
+    OptimizerCache(persist_path=str(path)).flush()
+    assert not path.exists()
+
+
+def test_key_depends_on_assets_solver_tag_and_version(cov, monkeypatch):
+    base = make_cache_key(cov, ASSETS, "fista:5000:1e-09")
+    assert base == make_cache_key(cov.copy(), list(ASSETS), "fista:5000:1e-09")
+    assert base != make_cache_key(cov, ASSETS[::-1], "fista:5000:1e-09")
+    assert base != make_cache_key(cov, ASSETS, "fista:1000:1e-09")
+
+    monkeypatch.setattr(optimizer_cache, "CACHE_FORMAT_VERSION", optimizer_cache.CACHE_FORMAT_VERSION + 1)
+    assert base != make_cache_key(cov, ASSETS, "fista:5000:1e-09")
+
+
+def test_key_ignores_rounding_noise_and_negative_zero(cov):
+    noisy = cov + 1e-14
+    flipped = cov.copy()
+    flipped[0, 1] = flipped[1, 0] = 0.0
+    negative = flipped.copy()
+    negative[0, 1] = negative[1, 0] = -0.0
+
+    assert make_cache_key(noisy, ASSETS) == make_cache_key(cov, ASSETS)
+    assert make_cache_key(negative, ASSETS) == make_cache_key(flipped, ASSETS)
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, optimizer_cache.CACHE_PATH),
+    ("off", None),
+    ("0", None),
+    ("/tmp/opt.json", "/tmp/opt.json"),
+])
+def test_default_persist_path_switch(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv(optimizer_cache.CACHE_ENV_VAR, raising=False)
+    else:
+        monkeypatch.setenv(optimizer_cache.CACHE_ENV_VAR, value)
+    assert optimizer_cache.default_persist_path() == expected
@@ -0,0 +1,123 @@
+import math
+
+import pandas as pd
+import pytest
+
+from portfolio.price_service import FileProvider, PriceService
+
+
+class Clock:
+    def __init__(self, now=1_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def write_snapshot(path, rows):
+    pd.DataFrame(rows).set_index("Ticker").to_csv(path)
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = tmp_path / "prices.csv"
+    write_snapshot(path, [
+        {"Ticker": "SPY", "Price": 101.0, "Prev_Close": 100.0, "Session": "2026-02-11"},
+        {"Ticker": "QQQ", "Price": 198.0, "Prev_Close": 200.0, "Session": "2026-02-11"},
+    ])
+    return path
+
+
+def make_service(path, ttl=60):
+    clock = Clock()
+    return PriceService(FileProvider(str(path)), ttl=ttl, clock=clock), clock
+
+
+def test_quotes_and_change_pct_from_cached_prior_close(snapshot):
+    service, _ = make_service(snapshot)
+    quotes = service.get_quotes(["SPY", "QQQ"])
+    assert quotes.at["SPY", "Price"] == 101.0
+    assert quotes.at["SPY", "Change_Pct"] == pytest.approx(1.0)
+    assert quotes.at["QQQ", "Change_Pct"] == pytest.approx(-1.0)
+
+
+def test_fresh_quotes_are_served_from_cache(snapshot):
+    service, clock = make_service(snapshot)
+    service.get_quotes(["SPY", "QQQ"])
+    calls = service.provider.calls
+
+    clock.now += 30
+    service.get_quotes(["SPY", "QQQ"])
+    assert service.provider.calls == calls
+
+
+def test_only_stale_tickers_are_refreshed_in_one_batch(snapshot):
+    service, clock = make_service(snapshot)
+    service.get_quotes(["SPY"])
+    clock.now += 30
+    service.get_quotes(["QQQ"])
+    service.provider.requests.clear()
+
+    # SPY is now 61s old and stale, QQQ is 31s old and fresh
+    clock.now += 31
+    service.get_quotes(["SPY", "QQQ"])
+    assert service.provider.requests == [("latest", ["SPY"])]
+
+
+def test_prior_close_refetched_only_on_new_session(snapshot):
+    service, clock = make_service(snapshot)
+    service.get_quotes(["SPY"])
+    service.provider.requests.clear()
+
+    clock.now += 61
+    service.get_quotes(["SPY"])
+    assert service.provider.requests == [("latest", ["SPY"])]
+
+    # Market opens on a new session: the prior close must move forward
+    write_snapshot(snapshot, [{"Ticker": "SPY", "Price": 103.0, "Prev_Close": 101.0, "Session": "2026-02-12"}])
+    service.provider.requests.clear()
+    clock.now += 61
+    quotes = service.get_quotes(["SPY"])
+    assert service.provider.requests == [("latest", ["SPY"]), ("prev_close", ["SPY"])]
+    assert quotes.at["SPY", "Change_Pct"] == pytest.approx((103.0 / 101.0 - 1) * 100)
+
+
+def test_missing_tickers_are_cached_as_misses(snapshot):
+    service, clock = make_service(snapshot)
+    assert service.get_price("XLE") is None
+    calls = service.provider.calls
+
+    service.get_quotes(["XLE"])
+    assert service.provider.calls == calls
+
+    clock.now += 61
+    service.get_quotes(["XLE"])
+    assert service.provider.calls == calls + 1
+
+
+def test_missing_prior_close_is_retried_after_ttl(snapshot):
+    write_snapshot(snapshot, [{"Ticker": "SPY", "Price": 101.0, "Session": "2026-02-11"}])
+    service, clock = make_service(snapshot)
+    assert math.isnan(service.get_quotes(["SPY"]).at["SPY", "Change_Pct"])
+
+    # Still fresh: no retry inside the TTL
+    service.provider.requests.clear()
+    clock.now += 30
+    service.get_quotes(["SPY"])
+    assert service.provider.requests == []
+
+    # The prior close becomes available; the next TTL refresh picks it up within the same session
+    write_snapshot(snapshot, [{"Ticker": "SPY", "Price": 101.0, "Prev_Close": 100.0, "Session": "2026-02-11"}])
+    clock.now += 31
+    quotes = service.get_quotes(["SPY"])
+    assert service.provider.requests == [("latest", ["SPY"]), ("prev_close", ["SPY"])]
+    assert quotes.at["SPY", "Change_Pct"] == pytest.approx(1.0)
+
+
+def test_change_pct_derived_from_legacy_snapshot(tmp_path):
+    path = tmp_path / "live_prices.csv"
+    pd.DataFrame({"Price": [50.0], "Change_Pct": [2.0]}, index=pd.Index(["XLU"], name="Ticker")).to_csv(path)
+    service, _ = make_service(path)
+    quotes = service.get_quotes(["XLU"])
+    assert quotes.at["XLU", "Change_Pct"] == pytest.approx(2.0)
+    assert not math.isnan(quotes.at["XLU", "Price"])
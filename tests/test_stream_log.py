@@ -0,0 +1,105 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from collectors.stream_log import (
+    INDEX_DTYPE, append_records, ensure_log, export_csv, import_csv, index_path_for, read_stream,
+)
+
+
+def make_history(n, dup_every=3):
+    # Every `dup_every` consecutive rows share a timestamp, like one collector batch
+    ts = pd.Timestamp("2026-02-10 09:00") + pd.to_timedelta(np.arange(n) // dup_every, unit="min")
+    return pd.DataFrame({
+        "Timestamp": ts,
+        "Published_At": [f"2026-02-10T08:{k % 60:02d}:00Z" for k in range(n)],
+        "Indicator": ["Labor_Market", "Inflation_Sentiment", "Manufacturing"] * (n // 3) + ["Labor_Market"] * (n % 3),
+        "Sentiment": np.linspace(-1, 1, n),
+        "Headline": [f"headline {k}" for k in range(n)],
+    })
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "history.csv"), str(tmp_path / "stream.log")
+
+
+def test_interrupted_import_resumes_without_gaps(paths):
+    csv_path, log_path = paths
+    history = make_history(30)
+    history.to_csv(csv_path, index=False)
+
+    # A killed first import: only a prefix reached the log, cut inside a same-timestamp batch
+    append_records(history.iloc[:13], log_path)
+
+    assert import_csv(csv_path, log_path) == 17
+    out = read_stream(log_path=log_path)
+    assert out["Headline"].tolist() == history["Headline"].tolist()
+
+    # Already in sync: nothing to import
+    assert import_csv(csv_path, log_path) == 0
+
+
+def test_ensure_log_migrates_once_then_never_reads_csv(paths, monkeypatch):
+    csv_path, log_path = paths
+    history = make_history(12)
+    history.to_csv(csv_path, index=False)
+    assert ensure_log(log_path, csv_path) == 12
+
+    # Once the log exists the CSV is not parsed again, even if it is torn
+    with open(csv_path, "a") as f:
+        f.write('2026-02-10 10:00:00,x,"torn')
+    monkeypatch.setattr(pd, "read_csv", lambda *a, **k: pytest.fail("CSV parsed after migration"))
+    assert ensure_log(log_path, csv_path) == 0
+    assert read_stream(log_path=log_path)["Headline"].tolist() == history["Headline"].tolist()
+
+
+def test_interrupted_migration_is_redone(paths):
+    csv_path, log_path = paths
+    history = make_history(12)
+    history.to_csv(csv_path, index=False)
+
+    # A killed migration leaves only temp files (or an index renamed without its log)
+    append_records(history.iloc[:5], log_path + ".migrating")
+    with open(index_path_for(log_path), "wb") as f:
+        f.write(b"\0" * INDEX_DTYPE.itemsize * 3)
+
+    assert ensure_log(log_path, csv_path) == 12
+    assert read_stream(log_path=log_path)["Headline"].tolist() == history["Headline"].tolist()
+    assert not os.path.exists(log_path + ".migrating")
+
+
+def test_export_csv_round_trips(paths, tmp_path):
+    _, log_path = paths
+    history = make_history(9)
+    append_records(history, log_path)
+
+    out_path = str(tmp_path / "export.csv")
+    assert export_csv(out_path, log_path=log_path) == 9
+    exported = pd.read_csv(out_path, parse_dates=["Timestamp"])
+    pd.testing.assert_frame_equal(exported, history, check_dtype=False)
+
+    window = history["Timestamp"].iloc[[3, 5]]
+    assert export_csv(out_path, window.iloc[0], window.iloc[1], log_path=log_path) == 3
+
+
+def test_read_stream_skips_records_past_end_of_log(paths):
+    _, log_path = paths
+    history = make_history(6)
+    append_records(history, log_path)
+
+    # Truncate the log inside the last record's payload, leaving the index untouched
+    index = np.fromfile(index_path_for(log_path), dtype=INDEX_DTYPE)
+    with open(log_path, "r+b") as f:
+        f.truncate(int(index["offset"][-1]) + 20)
+    assert os.path.getsize(index_path_for(log_path)) == len(history) * INDEX_DTYPE.itemsize
+
+    out = read_stream(log_path=log_path)
+    assert out["Headline"].tolist() == history["Headline"].tolist()[:-1]
+
+    # Truncated inside a header: also skipped
+    with open(log_path, "r+b") as f:
+        f.truncate(int(index["offset"][-2]) + 4)
+    assert len(read_stream(log_path=log_path)) == len(history) - 2
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from engine.universe import DEFAULT_UNIVERSE, load_universe
+
+
+def write_universe(tmp_path, overrides):
+    path = tmp_path / "universe.json"
+    path.write_text(json.dumps(overrides))
+    return str(path)
+
+
+def test_defaults_without_override(monkeypatch):
+    monkeypatch.delenv("SENTINEL_UNIVERSE", raising=False)
+    u = load_universe()
+    assert u["growth"] == DEFAULT_UNIVERSE["growth"]
+    assert u["core"] == DEFAULT_UNIVERSE["core"]
+    assert u["defensive"] == "SHY"
+    assert u["benchmark"] == "SPY"
+    assert u["market"] == DEFAULT_UNIVERSE["market"]
+
+
+def test_override_merges_with_defaults(tmp_path):
+    u = load_universe(write_universe(tmp_path, {
+        "growth": ["qqq", "XLK", "XLK"],
+        "defensive": "bil",
+        "unknown_key": ["IGNORED"],
+    }))
+
+    assert u["growth"] == ["QQQ", "XLK"]               # upper-cased, de-duplicated
+    assert u["defensive"] == "BIL"
+    assert u["core"] == DEFAULT_UNIVERSE["core"]        # untouched keys keep their defaults
+    assert u["watchlist"] == DEFAULT_UNIVERSE["watchlist"]
+    assert "unknown_key" not in u
+    # growth, core, defensive and benchmark are folded into the market list, in order, once each
+    assert u["market"] == DEFAULT_UNIVERSE["market"] + ["XLK", "BIL"]
+
+
+def test_env_var_override_without_spy(tmp_path, monkeypatch):
+    monkeypatch.setenv("SENTINEL_UNIVERSE", write_universe(tmp_path, {
+        "market": ["QQQ", "XLF", "XLU", "SHY"],
+        "growth": ["QQQ", "XLF", "XLU"],
+        "core": ["QQQ", "XLF"],
+        "benchmark": "XLU",
+    }))
+    u = load_universe()
+    assert u["market"] == ["QQQ", "XLF", "XLU", "SHY"]
+    assert u["core"] == ["QQQ", "XLF"]
+    assert u["benchmark"] == "XLU"
+
+
+@pytest.mark.parametrize("core", [["QQQ"], ["QQQ", "SPY", "XLF"], ["QQQ", "qqq"]])
+def test_core_must_name_two_tickers(tmp_path, capsys, core):
+    u = load_universe(write_universe(tmp_path, {"core": core}))
+    assert u["core"] == DEFAULT_UNIVERSE["core"]
+    assert "[WARNING]" in capsys.readouterr().out
+
+
+def test_unreadable_override_falls_back_to_defaults(tmp_path, capsys):
+    path = tmp_path / "broken.json"
+    path.write_text("{not json")
+    u = load_universe(str(path))
+    assert u["growth"] == DEFAULT_UNIVERSE["growth"]
+    assert "[WARNING]" in capsys.readouterr().out